@@ -6,13 +6,15 @@ and resource clean‑up logic in one place.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import time
 from pathlib import Path
 from typing import Optional
 
 import cv2
-from djitellopy import Tello
+from djitellopy import Tello, TelloException
 
 
 class TelloConnector:  # pylint: disable=too-few-public-methods
@@ -29,11 +31,20 @@ class TelloConnector:  # pylint: disable=too-few-public-methods
     #: region‑of‑interest cropping (downward camera is 320×240 optical-flow; we crop top‑left
     CROPPED_H = 240
     CROPPED_W = 320
+    _ROI = (slice(0, CROPPED_H), slice(0, CROPPED_W))
+
+    #: longest ``get_frame(fresh=True)`` waits for a newly decoded frame (s)
+    FRESH_FRAME_TIMEOUT_S = 0.1
+
+    #: how long stream start‑up waits for the first decoded frame (s)
+    FIRST_FRAME_TIMEOUT_S = 1.5
 
     def __init__(self, log_dir: str | Path | None = None) -> None:
         self.tello: Tello = None  # Will be initialized in connect()
         self.frame_read = None  # type: ignore[attr-defined]
         self._log_dir = Path(log_dir) if log_dir else None
+        self._last_frame = None
+        self._is_edu = False  # set from the SDK version query in connect()
 
     # ──────────────────────────────────────────────────────────────────
     # Setup / teardown
@@ -41,15 +52,70 @@ class TelloConnector:  # pylint: disable=too-few-public-methods
 
     def connect(self) -> None:
         """Connect, start stream, and optionally record telemetry logs."""
+        asyncio.run(self.connect_async())
+
+    def _query_is_edu(self) -> bool:
+        """Return whether the drone reports an SDK version (EDU / SDK ≥ 2.0).
+
+        Plain Tello firmware rejects ``sdk?``, so mission pads and
+        ``downvision`` are only attempted when this is ``True``.  A rejected
+        or timed-out query disables them with a warning rather than silently.
+        """
+        try:
+            version = self.tello.query_sdk_version()
+        except TelloException as e:
+            logging.warning("SDK version query rejected (%s); assuming plain Tello – "
+                            "mission pads and downward camera disabled.", e)
+            return False
+        # djitellopy reports a timeout by returning an "Aborting …" message
+        if version.startswith("Aborting"):
+            logging.warning("SDK version query timed out; mission pads and downward "
+                            "camera disabled for this session.")
+            return False
+        if not version.strip().isdigit():
+            logging.warning("Unexpected SDK version reply %r; mission pads and downward "
+                            "camera disabled.", version)
+            return False
+        logging.info("Tello SDK version %s (EDU features on)", version.strip())
+        return True
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Retry delay (s) after *attempt*: 0.5, 1, 2, 2, …"""
+        return min(2.0, 0.5 * 2 ** attempt)
+
+    async def _first_frame(self, initial):
+        """Return the first decoded frame, polling every 50 ms.
+
+        ``BackgroundFrameRead`` starts out holding a blank placeholder
+        array (*initial*) and assigns a new ndarray per decoded frame, so
+        the stream is up once ``frame`` is no longer that object.
+        """
+        while True:
+            frame = self.frame_read.frame
+            if frame is not None and frame is not initial:
+                return frame
+            await asyncio.sleep(0.05)
+
+    async def connect_async(self) -> None:
+        """Coroutine form of :meth:`connect`.
+
+        Blocking SDK calls run in the default executor, so callers can
+        overlap connection with other start‑up work via ``asyncio.gather``.
+        Fixed sleeps are replaced by exponential back‑off between retries
+        and by polling for the first frame every 50 ms.
+        """
+        loop = asyncio.get_running_loop()
         logging.info("Connecting to Tello …")
 
         # Initialize Tello with retry logic
         for attempt in range(3):
             try:
                 self.tello = Tello()
-                self.tello.connect()
+                await loop.run_in_executor(None, self.tello.connect)
                 battery = self.tello.get_battery()
                 logging.info("Tello battery: %s%%", battery)
+                self._is_edu = await loop.run_in_executor(None, self._query_is_edu)
 
                 if battery < 20:
                     logging.warning("Low battery! Consider charging before flight.")
@@ -58,12 +124,13 @@ class TelloConnector:  # pylint: disable=too-few-public-methods
 
             except OSError as e:
                 if "Address already in use" in str(e):
-                    logging.error(f"Connection attempt {attempt + 1} failed: Port already in use")
+                    logging.error("Connection attempt %d failed: Port already in use", attempt + 1)
                     if attempt < 2:
+                        delay = self._backoff(attempt)
                         logging.info("This usually means another Tello application is running.")
                         logging.info("Try running: python3 utils/tello_cleanup.py")
-                        logging.info("Waiting 2 seconds before retry...")
-                        time.sleep(2)
+                        logging.info("Waiting %.1f seconds before retry...", delay)
+                        await asyncio.sleep(delay)
                     else:
                         logging.error("All connection attempts failed. Please:")
                         logging.error("1. Run: python3 utils/tello_cleanup.py")
@@ -71,10 +138,10 @@ class TelloConnector:  # pylint: disable=too-few-public-methods
                         logging.error("3. Or restart the Tello drone")
                         raise
                 else:
-                    logging.error(f"Failed to connect to Tello: {e}")
+                    logging.error("Failed to connect to Tello: %s", e)
                     raise
             except Exception as e:
-                logging.error(f"Failed to connect to Tello: {e}")
+                logging.error("Failed to connect to Tello: %s", e)
                 logging.info("Make sure the Tello drone is powered on and connected to WiFi")
                 raise
 
@@ -82,26 +149,25 @@ class TelloConnector:  # pylint: disable=too-few-public-methods
         logging.info("Starting video stream...")
         for attempt in range(3):
             try:
-                self.tello.streamon()
-                time.sleep(1)  # Wait for stream to initialize
+                await loop.run_in_executor(None, self.tello.streamon)
+                self.frame_read = await loop.run_in_executor(None, self.tello.get_frame_read)
+                initial = self.frame_read.frame  # placeholder until the decoder runs
 
-                self.frame_read = self.tello.get_frame_read()
-                time.sleep(0.5)  # Wait for frame reader
-
-                # Test if we can get a frame
-                test_frame = self.frame_read.frame
-                if test_frame is not None:
-                    logging.info(f"✅ Stream started successfully! Frame shape: {test_frame.shape}")
-                    break
-                else:
-                    logging.warning(f"Stream attempt {attempt + 1}: No frames received")
+                # Poll for the first frame instead of sleeping a fixed 1.5 s
+                test_frame = await asyncio.wait_for(
+                    self._first_frame(initial), timeout=self.FIRST_FRAME_TIMEOUT_S
+                )
+                logging.info("✅ Stream started successfully! Frame shape: %s", test_frame.shape)
+                break
 
+            except asyncio.TimeoutError:
+                logging.warning("Stream attempt %d: No frames received", attempt + 1)
             except Exception as e:
-                logging.warning(f"Stream attempt {attempt + 1} failed: {e}")
+                logging.warning("Stream attempt %d failed: %s", attempt + 1, e)
 
             if attempt < 2:
                 logging.info("Retrying stream startup...")
-                time.sleep(1)
+                await asyncio.sleep(self._backoff(attempt))
         else:
             logging.error("Failed to start video stream after all attempts")
 
@@ -116,6 +182,9 @@ class TelloConnector:  # pylint: disable=too-few-public-methods
 
     def set_downward_camera(self) -> None:
         """Switch to the downward-facing 320×240 optical-flow camera (Tello EDU only)."""
+        if not self._is_edu:
+            logging.warning("Downward camera requires a Tello EDU; staying on the front camera.")
+            return
         self.tello.send_command_with_return("downvision 1")
         logging.debug("Downward-facing 320×240 optical-flow camera active.")
 
@@ -133,21 +202,66 @@ class TelloConnector:  # pylint: disable=too-few-public-methods
         logging.debug("Mission pad detection enabled.")
 
     def disable_mission_pads(self) -> None:
-        try:
+        if self._is_edu:  # Tello EDU only – nothing to disable on plain Tello
             self.tello.disable_mission_pads()
-        except Exception:  # Tello EDU only – ignore on plain Tello
-            pass
+
+    # ──────────────────────────────────────────────────────────────────
+    # RC control
+    # ──────────────────────────────────────────────────────────────────
+
+    def send_rc_cached(self, lr: int, fb: int, ud: int, yaw: int) -> None:
+        """Send an RC command with a cached ``rc`` payload string.
+
+        Every call is sent, repeats included: RC goes over UDP and the drone
+        acts on the last packet that arrives, so re‑sending each tick is what
+        covers for a lost hover or stop command.  Only the per‑call
+        ``str.format`` of ``Tello.send_rc_control`` is avoided.
+        """
+        self.tello.send_command_without_return(self._rc_cmd(lr, fb, ud, yaw))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _rc_cmd(lr: int, fb: int, ud: int, yaw: int) -> str:
+        """``rc`` SDK command, clamped to ±100 like djitellopy.
+
+        Hover/alignment phases repeat a handful of tuples, so after warm‑up
+        this is a dict lookup instead of a format.
+        """
+        return "rc %d %d %d %d" % (
+            max(-100, min(100, lr)),
+            max(-100, min(100, fb)),
+            max(-100, min(100, ud)),
+            max(-100, min(100, yaw)),
+        )
 
     # ──────────────────────────────────────────────────────────────────
     # Frame grab
     # ──────────────────────────────────────────────────────────────────
 
-    def get_frame(self, crop_to_roi: bool = True) -> Optional[cv2.Mat]:
-        """Return the latest video frame from the downward-facing 320×240 optical-flow camera, optionally cropped to 320×240."""
-        frame = None if self.frame_read is None else self.frame_read.frame
-        if frame is not None and crop_to_roi:
-            frame = frame[0 : self.CROPPED_H, 0 : self.CROPPED_W]
-        return frame
+    def get_frame(self, crop_to_roi: bool = True, fresh: bool = False) -> Optional[cv2.Mat]:
+        """Return the latest video frame from the downward-facing 320×240 optical-flow camera, optionally cropped to 320×240.
+
+        The cropped frame is a view into the reader's buffer, not a copy;
+        callers that draw on it must ``.copy()`` first.
+
+        With ``fresh=True`` a frame already returned by a previous call is
+        treated as stale: the call polls until the decoder publishes a new
+        one (or ``FRESH_FRAME_TIMEOUT_S`` elapses, in which case the stale
+        frame is returned).  ``BackgroundFrameRead`` assigns a new ndarray
+        per decoded frame, so object identity serves as the frame counter –
+        seeking by position (``CAP_PROP_POS_FRAMES``‑style) is unreliable on
+        a live UDP H.264 stream, and for control we want the current frame
+        or nothing rather than every intermediate one.
+        """
+        frame_read = self.frame_read
+        frame = None if frame_read is None else frame_read.frame
+        if fresh and frame is not None and frame is self._last_frame:
+            deadline = time.monotonic() + self.FRESH_FRAME_TIMEOUT_S
+            while frame is self._last_frame and time.monotonic() < deadline:
+                time.sleep(0.002)
+                frame = frame_read.frame
+        self._last_frame = frame
+        return frame if frame is None or not crop_to_roi else frame[self._ROI]
 
     # ──────────────────────────────────────────────────────────────────
     # Cleanup
@@ -160,11 +274,19 @@ class TelloConnector:  # pylint: disable=too-few-public-methods
             self.tello.streamoff()
         except Exception:  # stream may already be off
             pass
-        self.disable_mission_pads()
+        try:
+            self.disable_mission_pads()
+        except Exception:  # link may already be down
+            pass
         try:
             self.tello.end()
         except Exception:  # already ended
             pass
         cv2.destroyAllWindows()
-        time.sleep(0.2)  # allow UDP socket to close
+        # djitellopy keeps its control socket open for the process lifetime;
+        # what is still winding down is the frame reader's decode thread.
+        # Wait for that (bounded by the old fixed 0.2 s) instead of sleeping.
+        worker = getattr(self.frame_read, "worker", None)
+        if worker is not None and worker.is_alive():
+            worker.join(timeout=0.2)
         logging.info("Tello cleanup done.")
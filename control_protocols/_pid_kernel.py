@@ -0,0 +1,65 @@
+# control_protocols/_pid_kernel.py
+"""Inner 2-axis PID step shared by :class:`PIDControl`.
+
+Compiled with Numba when it is installed.  Otherwise the step runs as plain
+Python, using ``math.fma`` (Python 3.13+) for the gain products so each
+output is rounded once instead of three times.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+try:
+    from math import fma
+except ImportError:  # Python < 3.13
+    fma = None
+
+
+def _pid_step(ex, ey, dt, Kp, Ki, Kd, vmax, ilim, ix, iy, pex, pey):
+    """Advance one PID tick; return ``(vy, vx, ix, iy)`` in DJI RC order."""
+    ix = min(ilim, max(-ilim, ix + ex * dt))
+    iy = min(ilim, max(-ilim, iy + ey * dt))
+    dex = (ex - pex) / dt
+    dey = (ey - pey) / dt
+    ux = -Kp * ey - Ki * iy - Kd * dey
+    uy = -Kp * ex - Ki * ix - Kd * dex
+    if ux > vmax:
+        ux = vmax
+    elif ux < -vmax:
+        ux = -vmax
+    if uy > vmax:
+        uy = vmax
+    elif uy < -vmax:
+        uy = -vmax
+    return int(uy), int(ux), ix, iy
+
+
+def _pid_step_fma(ex, ey, dt, Kp, Ki, Kd, vmax, ilim, ix, iy, pex, pey):
+    """:func:`_pid_step` with the output sums evaluated as fused multiply-adds."""
+    ix = min(ilim, max(-ilim, fma(ex, dt, ix)))
+    iy = min(ilim, max(-ilim, fma(ey, dt, iy)))
+    dex = (ex - pex) / dt
+    dey = (ey - pey) / dt
+    ux = fma(-Kp, ey, fma(-Ki, iy, -Kd * dey))
+    uy = fma(-Kp, ex, fma(-Ki, ix, -Kd * dex))
+    return int(max(-vmax, min(vmax, uy))), int(max(-vmax, min(vmax, ux))), ix, iy
+
+
+if njit is not None:
+    pid_step = njit(cache=True, fastmath=True)(_pid_step)
+elif fma is not None:
+    pid_step = _pid_step_fma
+else:
+    pid_step = _pid_step
+
+
+def warm_up() -> None:
+    """Compile :func:`pid_step` now instead of on the first control tick.
+
+    Numba compiles lazily, so without this the first call after take-off
+    pays the JIT (or on-disk cache load) cost.  A no-op without Numba.
+    """
+    if njit is not None:
+        pid_step(0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0)
@@ -1,10 +1,12 @@
 # control_protocols/base_control.py
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
-class DroneControlLaw(ABC):
-    """Abstract base for P / PI / PID etc."""
+@runtime_checkable
+class DroneControlLaw(Protocol):
+    """Structural interface for P / PI / PID etc."""
+
+    __slots__ = ()
 
-    @abstractmethod
     def compute_control(self, error, **kwargs):
         """Return RC tuple ``(lr, fb, ud, yaw)`` from error vector."""
         raise NotImplementedError
@@ -1,9 +1,14 @@
 # control_protocols/pid_control.py
 
 import numpy as np
+
 from .base_control import DroneControlLaw
+from ._pid_kernel import pid_step, warm_up
 
 class PIDControl(DroneControlLaw):
+    __slots__ = ("Kp", "Ki", "Kd", "vmax", "integral_limit",
+                 "integral_x", "integral_y", "prev_error_x", "prev_error_y")
+
     def __init__(self, Kp=0.5, Ki=0.01, Kd=0.05, vmax=25, integral_limit=100):
         self.Kp = Kp
         self.Ki = Ki
@@ -15,24 +20,74 @@ class PIDControl(DroneControlLaw):
         self.integral_y = 0
         self.prev_error_x = 0
         self.prev_error_y = 0
+        warm_up()  # compile the kernel here, not inside the control loop
 
-    def compute_control(self, error, dt=0.07, **kwargs):
-        err_x, err_y = error[:2]
+    # Packed views for vectorised tuning / multi-axis experiments.  The hot
+    # path keeps reading the scalar slots; these are built on access.
+    @property
+    def gains(self) -> np.ndarray:
+        """``[Kp, Ki, Kd]`` as a float64 array."""
+        return np.array([self.Kp, self.Ki, self.Kd], dtype=np.float64)
+
+    @gains.setter
+    def gains(self, value) -> None:
+        self.Kp, self.Ki, self.Kd = (float(g) for g in value)
 
-        # Integral update with anti-windup
-        self.integral_x = np.clip(self.integral_x + err_x * dt, -self.integral_limit, self.integral_limit)
-        self.integral_y = np.clip(self.integral_y + err_y * dt, -self.integral_limit, self.integral_limit)
+    @property
+    def limits(self) -> np.ndarray:
+        """``[vmax, integral_limit]`` as a float64 array."""
+        return np.array([self.vmax, self.integral_limit], dtype=np.float64)
 
-        # Derivative calculation
-        d_err_x = (err_x - self.prev_error_x) / dt
-        d_err_y = (err_y - self.prev_error_y) / dt
+    @limits.setter
+    def limits(self, value) -> None:
+        self.vmax, self.integral_limit = (float(v) for v in value)
 
-        # PID control calculation
-        vx = int(np.clip(-self.Kp * err_y - self.Ki * self.integral_y - self.Kd * d_err_y, -self.vmax, self.vmax))
-        vy = int(np.clip(-self.Kp * err_x - self.Ki * self.integral_x - self.Kd * d_err_x, -self.vmax, self.vmax))
+    def reset(self) -> None:
+        """Clear the integral and derivative state, keeping the gains."""
+        self.integral_x = 0
+        self.integral_y = 0
+        self.prev_error_x = 0
+        self.prev_error_y = 0
+
+    def compute_control(self, error, dt=0.07, **kwargs):
+        err_x, err_y = error[:2]
+
+        # Integral update with anti-windup, derivative and clamped output
+        # are all done in one kernel call (Numba-compiled when available)
+        vy, vx, self.integral_x, self.integral_y = pid_step(
+            float(err_x), float(err_y), float(dt),
+            float(self.Kp), float(self.Ki), float(self.Kd),
+            float(self.vmax), float(self.integral_limit),
+            float(self.integral_x), float(self.integral_y),
+            float(self.prev_error_x), float(self.prev_error_y),
+        )
 
         # Store current errors for next iteration
         self.prev_error_x = err_x
         self.prev_error_y = err_y
 
         return vy, vx, 0, 0
+
+    def compute_control_batch(self, errors, dt=0.07) -> np.ndarray:
+        """Apply :meth:`compute_control` to each row of an ``(N, 2)`` error array.
+
+        Returns the ``(vy, vx)`` commands as an ``(N, 2)`` int array and
+        leaves the controller in the same state as N separate calls.  The
+        clamped integral depends on the order of the errors, so the steps
+        still run one by one.  Only the per-call unpacking and float
+        conversion is done once for the whole batch.
+        """
+        Kp, Ki, Kd = float(self.Kp), float(self.Ki), float(self.Kd)
+        vmax, ilim, dt = float(self.vmax), float(self.integral_limit), float(dt)
+        ix, iy = float(self.integral_x), float(self.integral_y)
+        pex, pey = float(self.prev_error_x), float(self.prev_error_y)
+
+        commands = []
+        for ex, ey in np.asarray(errors, dtype=np.float64)[:, :2].tolist():
+            vy, vx, ix, iy = pid_step(ex, ey, dt, Kp, Ki, Kd, vmax, ilim, ix, iy, pex, pey)
+            commands.append((vy, vx))
+            pex, pey = ex, ey
+
+        self.integral_x, self.integral_y = ix, iy
+        self.prev_error_x, self.prev_error_y = pex, pey
+        return np.array(commands, dtype=np.int64).reshape(-1, 2)
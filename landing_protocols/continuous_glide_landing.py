@@ -15,11 +15,12 @@ external callers (e.g. for updating the video feed during descent).
 
 import time
 import logging
+from math import hypot
 from typing import Optional, Tuple
 
-import numpy as np
-
 from landing_protocols.base_landing import LandingProtocolBase
+from utils import async_logger as alog
+from utils.periodic import PeriodicTicker
 from trackers.base_tracker import TrackerBase
 from control_protocols.base_control import DroneControlLaw
 
@@ -57,6 +58,9 @@ class ContinuousGlideLanding(LandingProtocolBase):
         commands for horizontal movement (roll, pitch, yaw).
     """
 
+    #: control loop period (s) – 20 Hz
+    CONTROL_PERIOD_S = 0.05
+
     def __init__(
         self,
         descent_gain: float = 0.3,
@@ -71,6 +75,8 @@ class ContinuousGlideLanding(LandingProtocolBase):
         self.descent_gain = descent_gain
         self.min_vz = min_vz
         self.max_vz = max_vz
+        self._vz_span = max_vz - min_vz
+        self._lost_vz = -int(min_vz)  # slowest descent while the target is lost
         self.height_threshold = height_threshold
         self.timeout = timeout
         self.tracker = tracker
@@ -87,13 +93,12 @@ class ContinuousGlideLanding(LandingProtocolBase):
         ``-min_vz``.
         """
         dx, dy = error
-        # Euclidean distance from centre
-        mag = float(np.hypot(dx, dy))
+        # Euclidean distance from centre (math.hypot avoids a 0-d ndarray per call)
+        mag = hypot(dx, dy)
         # Normalise so that error of 0 yields 1.0 and large error yields 0.0
-        normalised = max(0.0, 1.0 - mag / 100.0)
+        normalised = 0.0 if mag >= 100.0 else 1.0 - mag * 0.01
         # Interpolate between min_vz and max_vz and convert to negative for downwards
-        desired_speed = self.min_vz + (self.max_vz - self.min_vz) * normalised
-        return -int(desired_speed)
+        return -int(self.min_vz + self._vz_span * normalised)
 
     def land(self, tello, frame_read=None, visual_protocol=None, **kwargs) -> None:
         """Execute the continuous glide landing.
@@ -105,6 +110,14 @@ class ContinuousGlideLanding(LandingProtocolBase):
         drone is sufficiently low (as indicated by the time‑of‑flight
         sensor) or when the timeout expires.  At exit, ``self.finished``
         is set to ``True``.
+
+        Altitude comes from djitellopy's cached state packet (refreshed by
+        its UDP state thread at ~10 Hz), so reading it never blocks the loop.
+
+        Ticks are scheduled against absolute deadlines ``CONTROL_PERIOD_S``
+        apart, so tracker time is absorbed into the period instead of being
+        added to it, and the measured tick interval is passed to the control
+        law as ``dt``.
         """
         if self.tracker is None or self.control_protocol is None:
             logging.warning("Continuous glide landing requires a tracker and a control protocol.")
@@ -115,41 +128,57 @@ class ContinuousGlideLanding(LandingProtocolBase):
             frame_read = getattr(tello, 'frame_read', None)
 
         self.finished = False
-        start_time = time.time()
         logging.info("Starting continuous glide landing…")
+        connector = kwargs.get("connector")
+
+        # Bind hot-loop lookups to locals once; the loop body runs at ~20 Hz
+        process_frame = self.tracker.process_frame
+        compute = self.control_protocol.compute_control
+        descent = self._compute_descent_speed
+        lost_vz = self._lost_vz
+        send = connector.send_rc_cached if connector is not None else tello.send_rc_control
+        get_state = tello.get_current_state
+        now = time.monotonic
+        thresh = self.height_threshold
+        timeout = self.timeout
+        ticker = PeriodicTicker(self.CONTROL_PERIOD_S)
+        start_time = last_tick = now()
+        dt = self.CONTROL_PERIOD_S
 
         while True:
             frame = frame_read.frame if frame_read is not None else None
             if frame is not None:
-                found, error, _ = self.tracker.process_frame(frame)
+                found, error, _ = process_frame(frame)
                 if found:
-                    rc = self.control_protocol.compute_control(error)
+                    rc = compute(error, dt=dt)
                 else:
                     rc = (0, 0, 0, 0)  # hover if target lost
-                vz = self._compute_descent_speed(error[:2] if found else (np.inf, np.inf))
+                vz = descent(error[:2]) if found else lost_vz
                 lr, fb, _, yaw = rc
-                tello.send_rc_control(lr, fb, vz, yaw)
+                send(lr, fb, vz, yaw)
             else:
-                tello.send_rc_control(0, 0, 0, 0)
+                send(0, 0, 0, 0)
 
             # Check altitude using time‑of‑flight sensor; land if below threshold
-            try:
-                height = tello.get_distance_tof()
-                if height <= self.height_threshold:
-                    logging.info(f"Height {height:.1f} cm below threshold; executing final landing.")
-                    tello.send_rc_control(0, 0, 0, 0)
-                    tello.land()
-                    break
-            except Exception as e:
-                logging.debug(f"TOF read failed: {e}")
-
-            if time.time() - start_time > self.timeout:
+            height = get_state().get("tof")
+            if height is None:
+                alog.debug("TOF not yet in state packet")
+            elif height <= thresh:
+                logging.info("Height %.1f cm below threshold; executing final landing.", height)
+                send(0, 0, 0, 0)
+                tello.land()
+                break
+
+            if now() - start_time > timeout:
                 logging.warning("Continuous glide landing timeout expired; initiating final landing.")
-                tello.send_rc_control(0, 0, 0, 0)
+                send(0, 0, 0, 0)
                 tello.land()
                 break
 
-            time.sleep(0.05)
+            ticker.wait()
+            tick = now()
+            dt = tick - last_tick
+            last_tick = tick
 
         self.finished = True
         logging.info("Continuous glide landing complete.")
@@ -1,9 +1,9 @@
-import numpy as np
 import logging
 import time
 from typing import Optional
 
 from .base_landing import LandingProtocolBase
+from utils import async_logger as alog
 
 class MultiLayerLanding(LandingProtocolBase):
     def __init__(self,
@@ -30,17 +30,18 @@ class MultiLayerLanding(LandingProtocolBase):
     def land(self, tello, frame_read=None, visual_protocol=None, **kwargs) -> None:
         self.finished = False
         visual_protocol = visual_protocol or self.visual_protocol
-        logging.info(f"Landing in {self.layers} steps of {self.layer_height}cm each.")
+        logging.info("Landing in %d steps of %dcm each.", self.layers, self.layer_height)
         if frame_read is None:
             frame_read = getattr(tello, "frame_read", None)
+        connector = kwargs.get("connector")
         for layer in range(self.layers):
-            aligned = self._align_on_pad(tello, frame_read, layer, visual_protocol)
+            aligned = self._align_on_pad(tello, frame_read, layer, visual_protocol, connector)
             self._descend_layer(tello, aligned)
         logging.info("Final landing executed.")
         try:
             tello.land()
         except Exception as e:
-            logging.warning(f"Final land command failed: {e}")
+            logging.warning("Final land command failed: %s", e)
         self.finished = True
 
     def _descend_layer(self, tello, aligned: bool) -> None:
@@ -48,23 +49,23 @@ class MultiLayerLanding(LandingProtocolBase):
         time.sleep(0.1)
         try:
             # --- Safety: if we are already close to the ground, land directly ---
-            try:
-                current_h = tello.get_height()  # cm – supported by most Tello firmware
-            except Exception:
+            # One snapshot of djitellopy's cached state packet instead of a
+            # get_* call (and possible exception) per field.
+            state = tello.get_current_state()
+            current_h = state.get("h")  # cm – supported by most Tello firmware
+            if current_h is None:
                 # Fallback to TOF sensor (returns mm)
-                try:
-                    current_h = tello.get_distance_tof() / 10.0
-                except Exception:
-                    current_h = None
+                tof = state.get("tof")
+                current_h = tof / 10.0 if tof is not None else None
             if current_h is not None and current_h <= self.layer_height + 15:
-                logging.info(f"Height {current_h} cm ≤ safe margin; executing final land instead of {self.layer_height} cm descent.")
+                logging.info("Height %s cm ≤ safe margin; executing final land instead of %d cm descent.", current_h, self.layer_height)
                 tello.land()
                 self.finished = True
                 return
 
             if self.is_stable_imu(tello):
                 if aligned:
-                    logging.info(f"Stable. Descending {self.layer_height} cm.")
+                    logging.info("Stable. Descending %d cm.", self.layer_height)
                 else:
                     logging.warning("Descending without confirmed alignment; proceeding cautiously.")
                 tello.move("down", self.layer_height)
@@ -73,41 +74,51 @@ class MultiLayerLanding(LandingProtocolBase):
                 time.sleep(1)
                 return
         except Exception as e:
-            logging.error(f"Descending {self.layer_height}cm failed: {e}. Attempting direct land.")
+            logging.error("Descending %dcm failed: %s. Attempting direct land.", self.layer_height, e)
             try:
                 tello.land()
             except Exception as land_err:
-                logging.error(f"Direct land failed: {land_err}")
+                logging.error("Direct land failed: %s", land_err)
         time.sleep(0.3)
 
     def _align_on_pad(self,
                       tello,
                       frame_read,
                       layer: int,
-                      visual_protocol: Optional[object]) -> bool:
-        logging.info(f"Aligning on pad for layer {layer + 1}/{self.layers}")
+                      visual_protocol: Optional[object],
+                      connector: Optional[object] = None) -> bool:
+        logging.info("Aligning on pad for layer %d/%d", layer + 1, self.layers)
         start_time = time.time()
         aligned_count = 0
         if frame_read is None or self.tracker is None or self.control_protocol is None:
             logging.debug("No tracker/control available; performing time‑based alignment.")
             time.sleep(self.align_timeout)
             return True
-        while time.time() - start_time < self.align_timeout:
+        # Bind hot-loop lookups to locals once; the loop body runs at ~10 Hz
+        process_frame = self.tracker.process_frame
+        compute = self.control_protocol.compute_control
+        send = connector.send_rc_cached if connector is not None else tello.send_rc_control
+        now = time.time
+        sleep = time.sleep
+        align_timeout = self.align_timeout
+        threshold = self.align_threshold
+        frames_needed = self.aligned_frames_needed
+        while now() - start_time < align_timeout:
             frame = frame_read.frame
             if frame is None:
-                time.sleep(0.05)
+                sleep(0.05)
                 continue
             try:
-                found, error, debug = self.tracker.process_frame(frame)
+                found, error, debug = process_frame(frame)
             except Exception as e:
-                logging.warning(f"Tracker error during alignment: {e}")
+                alog.warning("Tracker error during alignment: %s", e)
                 found, error, debug = False, (0, 0, 0), {}
             if found:
-                rc = self.control_protocol.compute_control(error)
+                rc = compute(error)
                 lr, fb, _, yaw = rc
-                tello.send_rc_control(int(lr), int(fb), 0, int(yaw))
+                send(int(lr), int(fb), 0, int(yaw))
                 dx, dy = error[:2]
-                if abs(dx) < self.align_threshold and abs(dy) < self.align_threshold:
+                if abs(dx) < threshold and abs(dy) < threshold:
                     aligned_count += 1
                 else:
                     aligned_count = 0
@@ -129,12 +140,12 @@ class MultiLayerLanding(LandingProtocolBase):
                         except Exception:
                             pass
             else:
-                tello.send_rc_control(0, 0, 0, 0)
+                send(0, 0, 0, 0)
                 aligned_count = 0
-            if aligned_count >= self.aligned_frames_needed:
+            if aligned_count >= frames_needed:
                 logging.info("Alignment achieved.")
                 return True
-            time.sleep(0.1)
+            sleep(0.1)
         logging.warning("Alignment timeout reached; proceeding without confirmed alignment.")
         return False
 
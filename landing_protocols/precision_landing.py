@@ -1,10 +1,11 @@
 # landing_protocols/precision_landing.py
 
+import math
 import time
 import logging
-import numpy as np
 import cv2
 from .base_landing import LandingProtocolBase
+from utils.periodic import PeriodicTicker
 
 class PrecisionLandingProtocol(LandingProtocolBase):
     """
@@ -15,6 +16,9 @@ class PrecisionLandingProtocol(LandingProtocolBase):
     - Approach: Follows a slowly converging spiral or straight-line path toward the marker
     - Touchdown: Lands when marker fills a certain percentage of the frame
     """
+
+    # Spiral angle advance per approach tick (rad)
+    SPIRAL_STEP_RAD = 0.1
     
     def __init__(self, tracker, control_protocol, visual_protocol,
                  target_area_percentage=15.0,  # Percentage of frame the marker should fill
@@ -34,22 +38,59 @@ class PrecisionLandingProtocol(LandingProtocolBase):
         self.min_distance = min_distance
         self.spiral_radius = spiral_radius
         self.spiral_tightening_rate = spiral_tightening_rate
-        self.alignment_threshold = np.radians(alignment_threshold)
+        self.alignment_threshold = math.radians(alignment_threshold)
         self.position_threshold = position_threshold
         self.max_landing_time = max_landing_time
         
         # State variables
         self.landing_start_time = None
         self.current_phase = "SEARCH"
-        self.spiral_angle = 0.0
+        self.spiral_step = 0
+        self._spiral_offsets = self._build_spiral_offsets()
         self.last_detection_time = None
         self.detection_timeout = 2.0  # Seconds without detection before timeout
+        self._detection_timeout_ns = int(self.detection_timeout * 1e9)
         
         # PID controllers for smooth movement
         self.position_pid = None
         self.yaw_pid = None
         self._initialize_pids()
+        
+        # Set per landing from the ``connector`` kwarg; see _send_rc()
+        self._connector = None
+        
+        # Error-tuple unpacker, chosen on the first detection
+        self._unpack_error = None
+        
+        # Whether per-detection debug fields are filled in; refreshed in land()
+        self._debug_enabled = hasattr(visual_protocol, 'update')
     
+    def _build_spiral_offsets(self):
+        """Precompute the approach spiral's (x, y) offsets for every tick.
+
+        Entry ``k`` is the offset at angle ``(k + 1) * SPIRAL_STEP_RAD``.  The
+        table stops once the radius has decayed below 1 cm or after as many
+        ticks as the 20 Hz loop can run in ``max_landing_time``, whichever
+        comes first; past the end the last (smallest) offset is reused.
+        """
+        step = self.SPIRAL_STEP_RAD
+        max_ticks = int(self.max_landing_time * 20) + 1
+        offsets = []
+        for k in range(1, max_ticks + 1):
+            angle = k * step
+            radius = self.spiral_radius * self.spiral_tightening_rate ** (angle / (2 * math.pi))
+            offsets.append((radius * math.cos(angle), radius * math.sin(angle)))
+            if radius < 1.0:
+                break
+        return tuple(offsets)
+
+    def _send_rc(self, tello, lr, fb, ud, yaw):
+        """Send one RC command, via the connector's cached payloads when available."""
+        if self._connector is not None:
+            self._connector.send_rc_cached(lr, fb, ud, yaw)
+        else:
+            tello.send_rc_control(lr, fb, ud, yaw)
+
     def _initialize_pids(self):
         """Initialize PID controllers for position and yaw control."""
         try:
@@ -77,13 +118,23 @@ class PrecisionLandingProtocol(LandingProtocolBase):
     def land(self, tello, **kwargs):
         """Execute precision landing sequence."""
         self.finished = False
-        self.landing_start_time = time.time()
+        # Timeouts use integer monotonic nanoseconds: immune to wall-clock
+        # (NTP) steps and no float arithmetic per tick
+        self.landing_start_time = time.monotonic_ns()
+        deadline_ns = self.landing_start_time + int(self.max_landing_time * 1e9)
+        self._detection_timeout_ns = int(self.detection_timeout * 1e9)
         self.current_phase = "SEARCH"
+        self._connector = kwargs.get("connector")
         
         logging.info("Starting precision landing sequence")
+        ticker = PeriodicTicker(0.05)  # 20 FPS control loop
+        update_visual = getattr(self.visual_protocol, 'update', None)
+        # debug_info is only consumed by visual_protocol.update(); skip
+        # filling in the landing fields when nothing will read them
+        self._debug_enabled = update_visual is not None
         
         try:
-            while not self.finished and (time.time() - self.landing_start_time) < self.max_landing_time:
+            while not self.finished and time.monotonic_ns() < deadline_ns:
                 # Get current frame
                 frame_read = kwargs.get('frame_read')
                 if frame_read is None:
@@ -92,23 +143,26 @@ class PrecisionLandingProtocol(LandingProtocolBase):
                 
                 frame = frame_read.frame
                 if frame is None:
-                    time.sleep(0.1)
+                    # Hover rather than keep flying the last command, and
+                    # retry after one frame period
+                    self._send_rc(tello, 0, 0, 0, 0)
+                    time.sleep(0.02)
                     continue
                 
                 # Process frame with tracker
                 found, error_data, debug_info = self.tracker.process_frame(frame)
                 
                 if found:
-                    self.last_detection_time = time.time()
+                    self.last_detection_time = time.monotonic_ns()
                     self._handle_target_detected(tello, error_data, debug_info, frame)
                 else:
                     self._handle_no_target(tello, frame)
                 
                 # Update visualization
-                if hasattr(self.visual_protocol, 'update'):
-                    self.visual_protocol.update(frame, debug_info)
+                if update_visual is not None:
+                    update_visual(frame, debug_info)
                 
-                time.sleep(0.05)  # 20 FPS control loop
+                ticker.wait()
             
             if not self.finished:
                 logging.warning("Landing timeout reached, executing emergency landing")
@@ -122,22 +176,25 @@ class PrecisionLandingProtocol(LandingProtocolBase):
     
     def _handle_target_detected(self, tello, error_data, debug_info, frame):
         """Handle target detection and execute appropriate landing phase."""
-        if len(error_data) >= 5:  # Precision tracker returns 5 values
-            error_x, error_y, yaw_error, distance, area_percentage = error_data
-        else:
-            # Fallback for basic trackers
-            error_x, error_y = error_data[:2]
-            yaw_error = 0
-            distance = 100  # Default distance
-            area_percentage = 5  # Default area percentage
+        unpack = self._unpack_error
+        if unpack is None:
+            # The tracker is fixed for the protocol's lifetime, so its error
+            # layout is decided on the first detection and reused after that
+            if len(error_data) >= 5:  # Precision tracker returns 5 values
+                unpack = self._unpack_pose_error
+            else:
+                unpack = self._unpack_planar_error
+            self._unpack_error = unpack
+        error_x, error_y, yaw_error, distance, area_percentage = unpack(error_data)
         
         # Update debug info
-        debug_info.update({
-            "landing_phase": self.current_phase,
-            "area_percentage": area_percentage,
-            "distance": distance,
-            "yaw_error": np.degrees(yaw_error)
-        })
+        if self._debug_enabled:
+            debug_info.update({
+                "landing_phase": self.current_phase,
+                "area_percentage": area_percentage,
+                "distance": distance,
+                "yaw_error": math.degrees(yaw_error)
+            })
         
         # Phase transitions
         if self.current_phase == "SEARCH":
@@ -164,19 +221,33 @@ class PrecisionLandingProtocol(LandingProtocolBase):
         elif self.current_phase == "TOUCHDOWN":
             self._execute_touchdown(tello)
     
+    @staticmethod
+    def _unpack_pose_error(error_data):
+        """Precision tracker layout: (x, y, yaw, distance, area %)."""
+        return error_data
+
+    @staticmethod
+    def _unpack_planar_error(error_data):
+        """Fallback for basic trackers: (x, y, …) plus default pose fields."""
+        # yaw 0, distance 100 cm, area 5 %
+        return error_data[0], error_data[1], 0, 100, 5
+
     def _handle_no_target(self, tello, frame):
         """Handle cases when no target is detected."""
-        current_time = time.time()
+        current_time = time.monotonic_ns()
         
         if (self.last_detection_time is not None and 
-            current_time - self.last_detection_time > self.detection_timeout):
+            current_time - self.last_detection_time > self._detection_timeout_ns):
             # Lost target, return to search mode
             self.current_phase = "SEARCH"
             logging.warning("Target lost, returning to SEARCH phase")
         
-        # Execute search pattern
+        # Execute search pattern; while the target is only briefly lost
+        # (ALIGN/APPROACH, within detection_timeout) hold position instead
         if self.current_phase == "SEARCH":
             self._execute_search_pattern(tello)
+        else:
+            self._send_rc(tello, 0, 0, 0, 0)
         
         # Draw search indicator on frame
         h, w = frame.shape[:2]
@@ -188,33 +259,28 @@ class PrecisionLandingProtocol(LandingProtocolBase):
         # Use PID controllers if available
         if self.position_pid is not None:
             # PIDControl expects (error_x, error_y) and returns (vy, vx, 0, 0)
-            pos_cmd = self.position_pid.compute_control((error_x, error_y))
-            vy, vx, _, _ = pos_cmd
-            tello.send_rc_control(int(vx), int(vy), 0, 0)
+            vy, vx, _, _ = self.position_pid.compute_control((error_x, error_y))
+            x_cmd, y_cmd = vx, vy
         else:
             # Simple proportional control
-            x_cmd = np.clip(error_x * 0.3, -30, 30)
-            y_cmd = np.clip(error_y * 0.3, -30, 30)
-            tello.send_rc_control(int(x_cmd), int(y_cmd), 0, 0)
-        
-        # Yaw alignment
-        if self.yaw_pid is not None:
-            # For yaw, we need to create a simple proportional control since PIDControl is for x,y
-            yaw_cmd = np.clip(yaw_error * 0.5, -20, 20)
-            tello.send_rc_control(0, 0, 0, int(yaw_cmd))
-        else:
-            yaw_cmd = np.clip(yaw_error * 0.5, -20, 20)
-            tello.send_rc_control(0, 0, 0, int(yaw_cmd))
+            x_cmd = max(-30, min(30, error_x * 0.3))
+            y_cmd = max(-30, min(30, error_y * 0.3))
+        
+        # Yaw alignment – simple proportional control, since PIDControl is for x,y
+        yaw_cmd = max(-20, min(20, yaw_error * 0.5))
+        
+        # One combined command: separate position and yaw packets would
+        # each override the other's axes on the drone
+        self._send_rc(tello, int(x_cmd), int(y_cmd), 0, int(yaw_cmd))
     
     def _execute_approach(self, tello, error_x, error_y, yaw_error, distance, area_percentage):
         """Execute approach phase - spiral descent toward target."""
-        # Calculate spiral movement
-        self.spiral_angle += 0.1  # Increment spiral angle
-        spiral_radius = self.spiral_radius * (self.spiral_tightening_rate ** (self.spiral_angle / (2*np.pi)))
+        # Look up the precomputed spiral offset for this tick
+        offsets = self._spiral_offsets
+        spiral_x, spiral_y = offsets[min(self.spiral_step, len(offsets) - 1)]
+        self.spiral_step += 1
         
         # Combine spiral movement with target centering
-        spiral_x = spiral_radius * np.cos(self.spiral_angle)
-        spiral_y = spiral_radius * np.sin(self.spiral_angle)
         
         # Blend spiral and centering commands
         blend_factor = min(area_percentage / self.target_area_percentage, 1.0)
@@ -225,27 +291,27 @@ class PrecisionLandingProtocol(LandingProtocolBase):
         z_cmd = -10  # Slow descent
         
         # Apply commands
-        tello.send_rc_control(int(x_cmd), int(y_cmd), int(z_cmd), 0)
+        self._send_rc(tello, int(x_cmd), int(y_cmd), int(z_cmd), 0)
         
-        logging.debug(f"Approach: area={area_percentage:.1f}%, distance={distance:.1f}cm")
+        logging.debug("Approach: area=%.1f%%, distance=%.1fcm", area_percentage, distance)
     
     def _execute_approach_straight(self, tello, error_x, error_y, yaw_error, distance, area_percentage):
         """Execute straight-line approach (alternative to spiral)."""
         # Simple proportional control with downward movement
-        x_cmd = np.clip(error_x * 0.2, -20, 20)
-        y_cmd = np.clip(error_y * 0.2, -20, 20)
+        x_cmd = max(-20, min(20, error_x * 0.2))
+        y_cmd = max(-20, min(20, error_y * 0.2))
         z_cmd = -15  # Moderate descent
         
-        tello.send_rc_control(int(x_cmd), int(y_cmd), int(z_cmd), 0)
+        self._send_rc(tello, int(x_cmd), int(y_cmd), int(z_cmd), 0)
     
     def _execute_search_pattern(self, tello):
         """Execute search pattern when target is not detected."""
         # Gentle circular search pattern
         search_angle = time.time() * 0.5  # Slow rotation
-        x_cmd = 20 * np.cos(search_angle)
-        y_cmd = 20 * np.sin(search_angle)
+        x_cmd = 20 * math.cos(search_angle)
+        y_cmd = 20 * math.sin(search_angle)
         
-        tello.send_rc_control(int(x_cmd), int(y_cmd), 0, 0)
+        self._send_rc(tello, int(x_cmd), int(y_cmd), 0, 0)
     
     def _execute_touchdown(self, tello):
         """Execute final touchdown phase."""
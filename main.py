@@ -3,6 +3,7 @@
 import logging
 import time
 import cv2
+import numpy as np
 
 from connectors.tello_connector import TelloConnector
 from trackers.base_tracker import TrackerBase
@@ -18,16 +19,24 @@ from utils.setup_utils import (
     select_visual_protocol
 )
 from utils.tello_cleanup import check_drone_state, handle_motor_stop_error, safe_land
-from utils.config_manager import ConfigManager
+from utils.config_manager import get_config_manager
 from utils.config_factory import create_components_from_config
+from utils.periodic import PeriodicTicker
 from control_protocols.pid_control import PIDControl
 
 def main():
     setup_logger()
+
+    # Frames are a 320×240 ROI: OpenCV's internal thread pool costs more in
+    # dispatch than it saves at that size, and its workers would compete with
+    # the control, visual and frame-reader threads.  Keep SIMD paths on.
+    cv2.setNumThreads(1)
+    cv2.setUseOptimized(True)
+
     logging.info("Drone application initialized.")
 
     # Initialize configuration manager
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     
     # Ask user for configuration preference
     print("\n" + "="*50)
@@ -136,9 +145,15 @@ def main():
 
 
 class TelloTargetFollower:
+    #: largest correction (px) the latency predictor may add to each axis
+    PREDICT_MAX_SHIFT = 40.0
+    #: samples further apart than this (s) are not differenced (tracker stall)
+    PREDICT_MAX_GAP_S = 0.25
+
     def __init__(self, tello_connector, tracker, landing_protocol,
                  control_protocol, visual_protocol,
-                 takeoff_height=30, target_height=30, timeout=40):
+                 takeoff_height=30, target_height=30, timeout=40,
+                 predict_horizon=0.2):
 
         self.tello_connector = tello_connector
         self.tello = tello_connector.tello
@@ -151,12 +166,34 @@ class TelloTargetFollower:
         self.target_height = target_height
         self.timeout = timeout
 
+        # Video + command latency (s) the tracker error is extrapolated over;
+        # 0 disables prediction.  _prev_error holds (t, err_x, err_y).
+        self.predict_horizon = predict_horizon
+        self._prev_error = None
+
         self.running = True
         self.frame_read = None
 
+        # raw stream shape and the ROI slices derived from it; see _preprocess_frame()
+        self._last_frame_shape = None
+        self._roi_slice = None
+        # two preallocated transpose outputs, used alternately (ping-pong)
+        self._preproc_bufs = None
+        self._preproc_idx = 0
+
+        # centre-cross geometry, cached per frame shape by _draw_cross()
+        self._cross_shape = None
+        self._cross_center = (0, 0)
+        self._cross_size = 0
+
         # Initialize visual thread
         self.visual_thread = VisualThread(visual_protocol)
 
+        # Optional per-frame hooks, resolved once instead of hasattr() per frame
+        self._draw_debug_info = getattr(tracker, 'draw_debug_info', None)
+        self._display_frame = getattr(visual_protocol, '_display_frame', None)
+        self._quit_requested = getattr(visual_protocol, 'quit_requested', None)
+
     def run(self):
         # Initialize OpenCV window in main thread if needed
         if hasattr(self.visual_protocol, 'initialize_window'):
@@ -165,11 +202,9 @@ class TelloTargetFollower:
         self.visual_thread.start()  # Start visualization in separate thread
         try:
             self._takeoff_and_stabilize()
-            start_time = time.time()
+            deadline_ns = time.monotonic_ns() + int(self.timeout * 1e9)
             self.frame_read = self.tello_connector.frame_read
-            for _ in range(10):
-                _ = self.frame_read.frame
-                time.sleep(0.05)
+            ticker = PeriodicTicker(0.05)
             while self.running:
                 frame = self._get_frame()
                 if frame is None:
@@ -181,23 +216,23 @@ class TelloTargetFollower:
                 self._draw_cross(frame)
 
                 # Draw tracker-specific debug info (boundary annotations)
-                if hasattr(self.tracker, 'draw_debug_info'):
-                    self.tracker.draw_debug_info(frame, debug)
+                if self._draw_debug_info is not None:
+                    self._draw_debug_info(frame, debug)
 
-                # Send frame and debug to visualization thread
-                if self.visual_thread.is_alive():
-                    self.visual_thread.frame = frame
-                    self.visual_thread.debug = debug
+                # Send frame and debug to visualization thread.  publish() is a
+                # plain attribute store, harmless if the thread has exited, so
+                # no per-tick is_alive() (which takes the thread's state lock)
+                self.visual_thread.publish(frame, debug)
 
                 # Update OpenCV window in main thread to avoid threading issues
-                if hasattr(self.visual_protocol, '_display_frame'):
-                    self.visual_protocol._display_frame()
+                if self._display_frame is not None:
+                    self._display_frame()
 
                 self._handle_control(found, error)
                 self._check_quit()
-                self._check_timeout(start_time)
+                self._check_timeout(deadline_ns)
 
-                time.sleep(0.05)
+                ticker.wait()
 
         except Exception as critical_error:
             logging.exception(f"Critical error encountered: {critical_error}")
@@ -214,58 +249,118 @@ class TelloTargetFollower:
                 logging.warning("Frame reader is None")
                 return None
 
-            frame = self.frame_read.frame
+            # BackgroundFrameRead already decodes on its own thread; asking the
+            # connector for a *fresh* frame just guarantees the tracker never
+            # re-processes the frame it saw last tick (waits ≤ 0.1 s for one).
+            frame = self.tello_connector.get_frame(crop_to_roi=False, fresh=True)
             if frame is None:
                 return None
 
-            # Get frame dimensions
-            h, w = frame.shape[:2]
-
-            # Check for significant frame size changes (camera mode switch)
-            if not hasattr(self, '_last_frame_shape'):
-                self._last_frame_shape = frame.shape
-            elif frame.shape != self._last_frame_shape:
-                logging.warning(f"Frame size changed from {self._last_frame_shape} to {frame.shape} - camera mode may have switched")
-                self._last_frame_shape = frame.shape
-
-            logging.debug(f"Raw frame shape: {frame.shape}")
-
-            # Crop to ROI (ensure we don't exceed frame dimensions)
-            crop_h = min(240, h)
-            crop_w = min(320, w)
-            cropped = frame[0:crop_h, 0:crop_w]
-            logging.debug(f"Cropped frame shape: {cropped.shape}")
-
-            # Transpose if needed (depends on camera orientation)
-            transposed = cv2.transpose(cropped)
-            logging.debug(f"Transposed frame shape: {transposed.shape}")
-
-            return transposed
+            return self._preprocess_frame(frame)
 
         except Exception as e:
             logging.error(f"Frame processing error: {e}")
             return None
 
+    def _preprocess_frame(self, frame):
+        """Crop a raw stream frame to the ROI and transpose it.
+
+        Shared by the control loop and the takeoff/landing previews so all
+        three follow the same ROI and camera-switch handling.
+        """
+        # Check for significant frame size changes (camera mode switch);
+        # the ROI slices only need recomputing when the shape changes.
+        # ``ndarray.shape`` builds a new tuple per access, so read it once.
+        shape = frame.shape
+        if shape != self._last_frame_shape:
+            if self._last_frame_shape is not None:
+                logging.warning(f"Frame size changed from {self._last_frame_shape} to {shape} - camera mode may have switched")
+            self._last_frame_shape = shape
+            self._roi_slice = self._roi_for(shape)
+            rows, cols = (sl.stop for sl in self._roi_slice)
+            out_shape = (cols, rows) + shape[2:]
+            self._preproc_bufs = (np.empty(out_shape, frame.dtype), np.empty(out_shape, frame.dtype))
+
+        logging.debug("Raw frame shape: %s", shape)
+
+        # Crop to ROI (a view – no copy)
+        cropped = frame[self._roi_slice]
+        logging.debug("Cropped frame shape: %s", cropped.shape)
+
+        # Transpose if needed (depends on camera orientation).  This is the
+        # one copy on the path: the cross and tracker overlays are drawn
+        # on the result, and OpenCV cannot draw into a strided
+        # ``swapaxes`` view.  It is written into one of two preallocated
+        # buffers in turn, so no per-frame allocation; alternating leaves
+        # the previously published frame intact for a full tick while the
+        # visual thread copies it.
+        idx = self._preproc_idx
+        self._preproc_idx = idx ^ 1
+        transposed = cv2.transpose(cropped, dst=self._preproc_bufs[idx])
+        logging.debug("Transposed frame shape: %s", transposed.shape)
+
+        return transposed
+
+    def _prepare_preview(self, frame):
+        """:meth:`_preprocess_frame` plus the centre cross, for status previews."""
+        preview = self._preprocess_frame(frame)
+        self._draw_cross(preview)
+        return preview
+
+    @staticmethod
+    def _roi_for(shape):
+        """ROI slices for a frame of *shape*, clipped to the frame size."""
+        h, w = shape[:2]
+        return slice(0, min(240, h)), slice(0, min(320, w))
+
     def _handle_control(self, found, error):
         if found:
-            rc = self.control_protocol.compute_control(error)
+            rc = self.control_protocol.compute_control(self._predict_error(error))
             self.tello.send_rc_control(*rc)
-            logging.debug(f"Sent control: {rc}")
+            logging.debug("Sent control: %s", rc)
         else:
+            self._prev_error = None
             logging.warning("Target lost. Hovering.")
             self.tello.send_rc_control(0, 0, 0, 0)
 
+    def _predict_error(self, error):
+        """Extrapolate the tracker error ``predict_horizon`` seconds ahead.
+
+        By the time an RC command reaches the drone the frame it was
+        computed from is roughly 200 ms old (video + Wi-Fi command latency),
+        so a constant-velocity estimate from the last two samples is used to
+        command against where the target will be.  The shift is clamped to
+        ``PREDICT_MAX_SHIFT`` per axis so tracker jitter is not amplified,
+        and skipped after a gap longer than ``PREDICT_MAX_GAP_S``.
+        """
+        now = time.monotonic()
+        err_x, err_y = error[0], error[1]
+        prev = self._prev_error
+        self._prev_error = (now, err_x, err_y)
+        if prev is None or self.predict_horizon <= 0:
+            return error
+
+        dt = now - prev[0]
+        if dt <= 0 or dt > self.PREDICT_MAX_GAP_S:
+            return error
+
+        gain = self.predict_horizon / dt
+        lim = self.PREDICT_MAX_SHIFT
+        shift_x = max(-lim, min(lim, (err_x - prev[1]) * gain))
+        shift_y = max(-lim, min(lim, (err_y - prev[2]) * gain))
+        return (err_x + shift_x, err_y + shift_y, *error[2:])
+
     def _check_quit(self):
-        # Check for quit key in main thread
-        try:
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                logging.info("Quit signal received.")
-                self.running = False
-        except Exception as e:
-            logging.debug(f"Error checking quit key: {e}")
+        # The visual protocol's _display_frame() already pumps the window
+        # (poll_quit_key) and records 'q'; a second key poll here would
+        # add another blocking GUI poll per tick and could swallow the key.
+        if self._quit_requested is not None and self._quit_requested.is_set():
+            logging.info("Quit signal received.")
+            self.running = False
 
-    def _check_timeout(self, start_time):
-        if time.time() - start_time > self.timeout:
+    def _check_timeout(self, deadline_ns):
+        # Integer monotonic clock: unaffected by wall-clock (NTP) steps
+        if time.monotonic_ns() > deadline_ns:
             logging.info("Timeout reached, initiating landing.")
             self.running = False
 
@@ -282,35 +377,31 @@ class TelloTargetFollower:
                 landing_thread = threading.Thread(
                     target=self.landing_protocol.land,
                     args=(self.tello,),
-                    kwargs={"frame_read": self.frame_read},
+                    kwargs={"frame_read": self.frame_read,
+                            "connector": self.tello_connector},
                     daemon=True,
                 )
             else:
                 landing_thread = threading.Thread(
                     target=self.landing_protocol.land,
                     args=(self.tello,),
+                    kwargs={"connector": self.tello_connector},
                     daemon=True,
                 )
             landing_thread.start()
 
             # while landing is still in progress, keep updating the visual feed
+            ticker = PeriodicTicker(0.05)
             while not getattr(self.landing_protocol, "finished", True):
                 frame = self.tello_connector.frame_read.frame
                 if frame is not None:
-                    h, w = frame.shape[:2]
-                    crop_h = min(240, h)
-                    crop_w = min(320, w)
-                    cropped = frame[0:crop_h, 0:crop_w]
-                    transposed = cv2.transpose(cropped)
-                    self._draw_cross(transposed)
+                    transposed = self._prepare_preview(frame)
                     debug = {"status": "LANDING", "previews": []}
-                    if self.visual_thread.is_alive():
-                        self.visual_thread.frame = transposed
-                        self.visual_thread.debug = debug
+                    self.visual_thread.publish(transposed, debug)
                     # Update OpenCV window in main thread during landing
-                    if hasattr(self.visual_protocol, '_display_frame'):
-                        self.visual_protocol._display_frame()
-                time.sleep(0.05)
+                    if self._display_frame is not None:
+                        self._display_frame()
+                ticker.wait()
 
             landing_thread.join()
 
@@ -340,41 +431,38 @@ class TelloTargetFollower:
     def _takeoff_and_stabilize(self):
         logging.info("Drone taking off...")
         self.tello.takeoff()
-        start = time.time()
+        start = time.monotonic()
+        ticker = PeriodicTicker(0.05)
         ascend_sent = False
         # loop for ~3 s: send the 'up' command once, then keep updating the view
-        while time.time() - start < 3.0:
-            if not ascend_sent and time.time() - start > 0.1:
+        while time.monotonic() - start < 3.0:
+            if not ascend_sent and time.monotonic() - start > 0.1:
                 self.tello.move('up', self.takeoff_height)
                 ascend_sent = True
 
             # get a frame from the stream
             frame = self.tello_connector.frame_read.frame
             if frame is not None:
-                # reuse the same cropping/transposition you do in _get_frame()
-                h, w = frame.shape[:2]
-                crop_h = min(240, h)
-                crop_w = min(320, w)
-                cropped = frame[0:crop_h, 0:crop_w]
-                transposed = cv2.transpose(cropped)
-                # draw the centre cross
-                self._draw_cross(transposed)
+                transposed = self._prepare_preview(frame)
                 # minimal debug info for take‑off phase
                 debug = {"status": "TAKEOFF", "previews": []}
-                if self.visual_thread.is_alive():
-                    self.visual_thread.frame = transposed
-                    self.visual_thread.debug = debug
-            time.sleep(0.05)
+                self.visual_thread.publish(transposed, debug)
+            ticker.wait()
 
         logging.info(f"Drone stabilized at {self.takeoff_height} cm.")
 
 
 
     def _draw_cross(self, frame):
-        h, w = frame.shape[:2]
-        center = (w // 2, h // 2)
-        size = int(min(w, h) * 0.06)
-        cv2.drawMarker(frame, center, (255, 0, 0), markerType=cv2.MARKER_CROSS, markerSize=size, thickness=2)
+        # Marker geometry only changes with the frame shape (camera switch)
+        shape = frame.shape
+        if shape != self._cross_shape:
+            h, w = shape[:2]
+            self._cross_shape = shape
+            self._cross_center = (w // 2, h // 2)
+            self._cross_size = int(min(w, h) * 0.06)
+        cv2.drawMarker(frame, self._cross_center, (255, 0, 0), markerType=cv2.MARKER_CROSS,
+                       markerSize=self._cross_size, thickness=2)
 
 
 def post_flight_cleanup(tello_connector):
@@ -2,35 +2,82 @@
 """
 Configuration management script for the drone project.
 Allows users to create, edit, and manage configuration files.
+
+Run without arguments for the interactive menu, or pass a subcommand for
+one-shot, scriptable use, e.g.::
+
+    python manage_config.py create fast --set control_protocol.type=pid \
+        --set control_protocol.parameters.Kp=0.4
+    python manage_config.py copy fast fast_backup
+
+Section parameters are edited as JSON in ``$EDITOR``, from the menu or
+with ``python manage_config.py edit fast``; add ``--legacy`` to be
+prompted for each parameter instead.
 """
 
-import sys
+import argparse
 import json
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
 from pathlib import Path
 
-# Add the project root to the path
-sys.path.append('.')
-
-from utils.config_manager import ConfigManager, create_config_from_user_input
+from utils.config_manager import get_config_manager, create_config_from_user_input, dumps_config, loads_config
 from utils.logging_utils import setup_logger
 
+# Value type of every parameter the interactive editors prompt for
+_PARAM_TYPES = {
+    # tracker
+    "min_radius": int, "max_radius": int, "min_circularity": float, "min_area": int,
+    # control protocol
+    "Kp": float, "Ki": float, "Kd": float, "vmax": int, "integral_limit": int,
+    # landing protocol
+    "layers": int, "layer_height": int, "align_timeout": float, "align_threshold": int,
+    "aligned_frames": int, "velocity_threshold": float,
+    # visual protocol
+    "window_name": str, "debug_level": str,
+    "grid_rows": int, "grid_cols": int, "cell_width": int, "cell_height": int,
+    # drone settings
+    "takeoff_height": int, "target_height": int, "timeout": int,
+}
+
+# Menus are pre-joined so each redraw is a single write to stdout
+_MAIN_MENU = "\n".join([
+    "\n" + "=" * 50,
+    "CONFIGURATION MANAGEMENT",
+    "=" * 50,
+    "1. List all configurations",
+    "2. Create new configuration",
+    "3. Edit existing configuration",
+    "4. Delete configuration",
+    "5. View configuration details",
+    "6. Copy configuration",
+    "7. Exit",
+])
+
+_EDIT_MENU = "\n".join([
+    "1. Edit tracker settings",
+    "2. Edit control protocol settings",
+    "3. Edit landing protocol settings",
+    "4. Edit visual protocol settings",
+    "5. Edit drone settings",
+    "6. Save and finish",
+    "7. Cancel",
+])
+
 def main():
     """Main configuration management interface."""
     setup_logger()
     
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
+    
+    if len(sys.argv) > 1:
+        sys.exit(run_command(config_manager, sys.argv[1:]))
     
     while True:
-        print("\n" + "="*50)
-        print("CONFIGURATION MANAGEMENT")
-        print("="*50)
-        print("1. List all configurations")
-        print("2. Create new configuration")
-        print("3. Edit existing configuration")
-        print("4. Delete configuration")
-        print("5. View configuration details")
-        print("6. Copy configuration")
-        print("7. Exit")
+        print(_MAIN_MENU)
         
         choice = input("\nSelect option (1-7): ").strip()
         
@@ -56,12 +103,12 @@ def list_configurations(config_manager):
     """List all available configurations."""
     configs = config_manager.list_configs()
     if configs:
-        print(f"\nAvailable configurations ({len(configs)}):")
-        for i, config_name in enumerate(configs, 1):
-            print(f"  {i}. {config_name}")
+        lines = [f"\nAvailable configurations ({len(configs)}):"]
+        lines += [f"  {i}. {config_name}" for i, config_name in enumerate(configs, 1)]
+        print("\n".join(lines))
     else:
-        print("\nNo configuration files found.")
-        print("Use option 2 to create your first configuration.")
+        print("\nNo configuration files found.\n"
+              "Use option 2 to create your first configuration.")
 
 def create_configuration(config_manager):
     """Create a new configuration file."""
@@ -75,7 +122,7 @@ def create_configuration(config_manager):
             print("Configuration name cannot be empty.")
             return
         
-        if config_name in config_manager.list_configs():
+        if config_manager.has_config(config_name):
             overwrite = input(f"Configuration '{config_name}' already exists. Overwrite? (y/N): ").strip().lower()
             if overwrite != 'y':
                 print("Configuration creation cancelled.")
@@ -87,48 +134,52 @@ def create_configuration(config_manager):
     except Exception as e:
         print(f"Error creating configuration: {e}")
 
-def edit_configuration(config_manager):
-    """Edit an existing configuration file."""
-    configs = config_manager.list_configs()
-    if not configs:
-        print("No configurations to edit.")
-        return
-    
-    print(f"\nAvailable configurations: {', '.join(configs)}")
-    config_name = input("Enter configuration name to edit: ").strip()
+def edit_configuration(config_manager, legacy=False, config_name=None):
+    """Edit an existing configuration file, prompting for its name if not given."""
+    if config_name is None:
+        configs = config_manager.list_configs()
+        if not configs:
+            print("No configurations to edit.")
+            return
+        
+        print(f"\nAvailable configurations: {', '.join(configs)}")
+        config_name = input("Enter configuration name to edit: ").strip()
     
-    if config_name not in configs:
+    if not config_manager.has_config(config_name):
         print(f"Configuration '{config_name}' not found.")
         return
     
     try:
         config = config_manager.load_config(config_name)
         
-        print(f"\nEditing configuration: {config_name}")
-        print("1. Edit tracker settings")
-        print("2. Edit control protocol settings")
-        print("3. Edit landing protocol settings")
-        print("4. Edit visual protocol settings")
-        print("5. Edit drone settings")
-        print("6. Cancel")
+        # Edit any number of sections in memory, then write the file once
+        editors = {
+            "1": edit_tracker_settings,
+            "2": edit_control_settings,
+            "3": edit_landing_settings,
+            "4": edit_visual_settings,
+            "5": edit_drone_settings,
+        }
+        edited = False
         
-        edit_choice = input("Select section to edit (1-6): ").strip()
+        while True:
+            print(f"\nEditing configuration: {config_name}\n{_EDIT_MENU}")
+            
+            edit_choice = input("Select section to edit (1-7): ").strip()
+            
+            if edit_choice in editors:
+                editors[edit_choice](config, legacy)
+                edited = True
+            elif edit_choice == "6":
+                break
+            elif edit_choice == "7":
+                print("Edit cancelled.")
+                return
+            else:
+                print("Invalid choice.")
         
-        if edit_choice == "1":
-            edit_tracker_settings(config)
-        elif edit_choice == "2":
-            edit_control_settings(config)
-        elif edit_choice == "3":
-            edit_landing_settings(config)
-        elif edit_choice == "4":
-            edit_visual_settings(config)
-        elif edit_choice == "5":
-            edit_drone_settings(config)
-        elif edit_choice == "6":
-            print("Edit cancelled.")
-            return
-        else:
-            print("Invalid choice.")
+        if not edited:
+            print("No changes made.")
             return
         
         config_manager.save_config(config, config_name)
@@ -137,22 +188,83 @@ def edit_configuration(config_manager):
     except Exception as e:
         print(f"Error editing configuration: {e}")
 
-def edit_tracker_settings(config):
+def _edit_params_in_editor(params, names):
+    """Open *params* as JSON in ``$EDITOR`` and return the edited dict.
+    
+    Every name in *names* is listed (``null`` when unset) so the available
+    parameters are visible; keys left ``null`` are dropped.  If the editor
+    fails, the result is not a JSON object, or a value does not match its
+    type in ``_PARAM_TYPES``, *params* is returned unchanged.
+    """
+    draft = dict(params)
+    for name in names:
+        draft.setdefault(name, None)
+    
+    fd, path = tempfile.mkstemp(prefix="drone_params_", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(dumps_config(draft))
+        editor = shlex.split(os.environ.get("VISUAL") or os.environ.get("EDITOR") or "vi")
+        if subprocess.call(editor + [path]) != 0:
+            print("Editor exited with an error, keeping current values.")
+            return params
+        with open(path, "rb") as f:
+            edited = loads_config(f.read())
+    except (OSError, ValueError) as e:
+        print(f"Could not edit parameters ({e}), keeping current values.")
+        return params
+    finally:
+        os.unlink(path)
+    
+    if not isinstance(edited, dict):
+        print("Parameters must be a JSON object, keeping current values.")
+        return params
+    try:
+        return {key: _coerce_param(key, value) for key, value in edited.items() if value is not None}
+    except ValueError as e:
+        print(f"{e}, keeping current values.")
+        return params
+
+def _coerce_param(name, value):
+    """Return a JSON *value* as ``_PARAM_TYPES[name]``, or raise ``ValueError``.
+    
+    Ints are accepted for float parameters and integral floats (``5.0``)
+    for int parameters; anything else of the wrong type – including
+    booleans and numeric strings – is rejected rather than converted.
+    Names missing from ``_PARAM_TYPES`` pass through unchanged.
+    """
+    kind = _PARAM_TYPES.get(name)
+    if kind is None:
+        return value
+    if not isinstance(value, bool):
+        if kind is float and isinstance(value, (int, float)):
+            return float(value)
+        if kind is int and (isinstance(value, int) or (isinstance(value, float) and value.is_integer())):
+            return int(value)
+        if kind is str and isinstance(value, str):
+            return value
+    raise ValueError(f"Invalid value for {name}: expected {kind.__name__}, got {value!r}")
+
+def edit_tracker_settings(config, legacy=False):
     """Edit tracker settings in configuration."""
-    print("\nCurrent tracker settings:")
     tracker_config = config.get("tracker", {})
-    print(f"  Type: {tracker_config.get('type', 'circle')}")
-    print(f"  Parameters: {tracker_config.get('parameters', {})}")
-    
-    print("\nAvailable tracker types:")
-    print("  circle, aruco, precisionaruco, missionpad, colorpatch, darkrect, lightrect, phone, simplephone")
+    print(f"\nCurrent tracker settings:\n"
+          f"  Type: {tracker_config.get('type', 'circle')}\n"
+          f"  Parameters: {tracker_config.get('parameters', {})}\n"
+          "\nAvailable tracker types:\n"
+          "  circle, aruco, precisionaruco, missionpad, colorpatch, darkrect, lightrect, phone, simplephone")
     
     new_type = input("Enter new tracker type (or press Enter to keep current): ").strip()
     if new_type:
         tracker_config["type"] = new_type
     
-    print("Enter new parameters (press Enter to skip each):")
     params = tracker_config.get("parameters", {})
+    if not legacy:
+        tracker_config["parameters"] = _edit_params_in_editor(params, ["min_radius", "max_radius", "min_circularity", "min_area"])
+        config["tracker"] = tracker_config
+        return
+    
+    print("Enter new parameters (press Enter to skip each):")
     
     # Common parameters
     for param in ["min_radius", "max_radius", "min_circularity", "min_area"]:
@@ -160,32 +272,33 @@ def edit_tracker_settings(config):
         new_value = input(f"  {param} [{current}]: ").strip()
         if new_value:
             try:
-                if "." in new_value:
-                    params[param] = float(new_value)
-                else:
-                    params[param] = int(new_value)
+                params[param] = _PARAM_TYPES[param](new_value)
             except ValueError:
                 print(f"Invalid value for {param}, keeping current value.")
     
     tracker_config["parameters"] = params
     config["tracker"] = tracker_config
 
-def edit_control_settings(config):
+def edit_control_settings(config, legacy=False):
     """Edit control protocol settings in configuration."""
-    print("\nCurrent control protocol settings:")
     control_config = config.get("control_protocol", {})
-    print(f"  Type: {control_config.get('type', 'pid')}")
-    print(f"  Parameters: {control_config.get('parameters', {})}")
-    
-    print("\nAvailable control types:")
-    print("  proportional, pi, pid")
+    print(f"\nCurrent control protocol settings:\n"
+          f"  Type: {control_config.get('type', 'pid')}\n"
+          f"  Parameters: {control_config.get('parameters', {})}\n"
+          "\nAvailable control types:\n"
+          "  proportional, pi, pid")
     
     new_type = input("Enter new control type (or press Enter to keep current): ").strip()
     if new_type:
         control_config["type"] = new_type
     
-    print("Enter new parameters (press Enter to skip each):")
     params = control_config.get("parameters", {})
+    if not legacy:
+        control_config["parameters"] = _edit_params_in_editor(params, ["Kp", "Ki", "Kd", "vmax", "integral_limit"])
+        config["control_protocol"] = control_config
+        return
+    
+    print("Enter new parameters (press Enter to skip each):")
     
     # PID parameters
     for param in ["Kp", "Ki", "Kd", "vmax", "integral_limit"]:
@@ -193,32 +306,33 @@ def edit_control_settings(config):
         new_value = input(f"  {param} [{current}]: ").strip()
         if new_value:
             try:
-                if param in ["Kp", "Ki", "Kd"]:
-                    params[param] = float(new_value)
-                else:
-                    params[param] = int(new_value)
+                params[param] = _PARAM_TYPES[param](new_value)
             except ValueError:
                 print(f"Invalid value for {param}, keeping current value.")
     
     control_config["parameters"] = params
     config["control_protocol"] = control_config
 
-def edit_landing_settings(config):
+def edit_landing_settings(config, legacy=False):
     """Edit landing protocol settings in configuration."""
-    print("\nCurrent landing protocol settings:")
     landing_config = config.get("landing_protocol", {})
-    print(f"  Type: {landing_config.get('type', 'multilayer')}")
-    print(f"  Parameters: {landing_config.get('parameters', {})}")
-    
-    print("\nAvailable landing types:")
-    print("  simple, multilayer, precision, continuousglide")
+    print(f"\nCurrent landing protocol settings:\n"
+          f"  Type: {landing_config.get('type', 'multilayer')}\n"
+          f"  Parameters: {landing_config.get('parameters', {})}\n"
+          "\nAvailable landing types:\n"
+          "  simple, multilayer, precision, continuousglide")
     
     new_type = input("Enter new landing type (or press Enter to keep current): ").strip()
     if new_type:
         landing_config["type"] = new_type
     
-    print("Enter new parameters (press Enter to skip each):")
     params = landing_config.get("parameters", {})
+    if not legacy:
+        landing_config["parameters"] = _edit_params_in_editor(params, ["layers", "layer_height", "align_timeout", "align_threshold", "aligned_frames", "velocity_threshold"])
+        config["landing_protocol"] = landing_config
+        return
+    
+    print("Enter new parameters (press Enter to skip each):")
     
     # Common parameters
     for param in ["layers", "layer_height", "align_timeout", "align_threshold", "aligned_frames", "velocity_threshold"]:
@@ -226,32 +340,36 @@ def edit_landing_settings(config):
         new_value = input(f"  {param} [{current}]: ").strip()
         if new_value:
             try:
-                if param in ["align_timeout", "velocity_threshold"]:
-                    params[param] = float(new_value)
-                else:
-                    params[param] = int(new_value)
+                params[param] = _PARAM_TYPES[param](new_value)
             except ValueError:
                 print(f"Invalid value for {param}, keeping current value.")
     
     landing_config["parameters"] = params
     config["landing_protocol"] = landing_config
 
-def edit_visual_settings(config):
+def edit_visual_settings(config, legacy=False):
     """Edit visual protocol settings in configuration."""
-    print("\nCurrent visual protocol settings:")
     visual_config = config.get("visual_protocol", {})
-    print(f"  Type: {visual_config.get('type', 'opencv')}")
-    print(f"  Parameters: {visual_config.get('parameters', {})}")
-    
-    print("\nAvailable visual types:")
-    print("  opencv, logger, grid")
+    print(f"\nCurrent visual protocol settings:\n"
+          f"  Type: {visual_config.get('type', 'opencv')}\n"
+          f"  Parameters: {visual_config.get('parameters', {})}\n"
+          "\nAvailable visual types:\n"
+          "  opencv, logger, grid")
     
     new_type = input("Enter new visual type (or press Enter to keep current): ").strip()
     if new_type:
         visual_config["type"] = new_type
     
-    print("Enter new parameters (press Enter to skip each):")
     params = visual_config.get("parameters", {})
+    if not legacy:
+        names = ["window_name", "debug_level"]
+        if visual_config.get("type") == "grid":
+            names += ["grid_rows", "grid_cols", "cell_width", "cell_height"]
+        visual_config["parameters"] = _edit_params_in_editor(params, names)
+        config["visual_protocol"] = visual_config
+        return
+    
+    print("Enter new parameters (press Enter to skip each):")
     
     # Common parameters
     for param in ["window_name", "debug_level"]:
@@ -267,29 +385,31 @@ def edit_visual_settings(config):
             new_value = input(f"  {param} [{current}]: ").strip()
             if new_value:
                 try:
-                    params[param] = int(new_value)
+                    params[param] = _PARAM_TYPES[param](new_value)
                 except ValueError:
                     print(f"Invalid value for {param}, keeping current value.")
     
     visual_config["parameters"] = params
     config["visual_protocol"] = visual_config
 
-def edit_drone_settings(config):
+def edit_drone_settings(config, legacy=False):
     """Edit drone settings in configuration."""
-    print("\nCurrent drone settings:")
     drone_settings = config.get("drone_settings", {})
-    print(f"  {drone_settings}")
+    print(f"\nCurrent drone settings:\n  {drone_settings}")
     
-    print("Enter new settings (press Enter to skip each):")
-    
-    for param in ["takeoff_height", "target_height", "timeout"]:
-        current = drone_settings.get(param, "")
-        new_value = input(f"  {param} [{current}]: ").strip()
-        if new_value:
-            try:
-                drone_settings[param] = int(new_value)
-            except ValueError:
-                print(f"Invalid value for {param}, keeping current value.")
+    if not legacy:
+        drone_settings = _edit_params_in_editor(drone_settings, ["takeoff_height", "target_height", "timeout"])
+    else:
+        print("Enter new settings (press Enter to skip each):")
+        
+        for param in ["takeoff_height", "target_height", "timeout"]:
+            current = drone_settings.get(param, "")
+            new_value = input(f"  {param} [{current}]: ").strip()
+            if new_value:
+                try:
+                    drone_settings[param] = _PARAM_TYPES[param](new_value)
+                except ValueError:
+                    print(f"Invalid value for {param}, keeping current value.")
     
     # Camera mode is always downward-facing 320×240 optical-flow camera
     print("\nCamera mode: Always downward-facing 320×240 optical-flow camera (not configurable)")
@@ -306,15 +426,14 @@ def delete_configuration(config_manager):
     print(f"\nAvailable configurations: {', '.join(configs)}")
     config_name = input("Enter configuration name to delete: ").strip()
     
-    if config_name not in configs:
+    if not config_manager.has_config(config_name):
         print(f"Configuration '{config_name}' not found.")
         return
     
     confirm = input(f"Are you sure you want to delete '{config_name}'? (y/N): ").strip().lower()
     if confirm == 'y':
         try:
-            config_path = config_manager.config_dir / f"{config_name}.json"
-            config_path.unlink()
+            config_manager.delete_config(config_name)
             print(f"Configuration '{config_name}' deleted successfully!")
         except Exception as e:
             print(f"Error deleting configuration: {e}")
@@ -331,15 +450,13 @@ def view_configuration(config_manager):
     print(f"\nAvailable configurations: {', '.join(configs)}")
     config_name = input("Enter configuration name to view: ").strip()
     
-    if config_name not in configs:
+    if not config_manager.has_config(config_name):
         print(f"Configuration '{config_name}' not found.")
         return
     
     try:
         config = config_manager.load_config(config_name)
-        print(f"\nConfiguration: {config_name}")
-        print("=" * 50)
-        print(json.dumps(config, indent=2))
+        print(f"\nConfiguration: {config_name}\n{'=' * 50}\n{dumps_config(config)}")
     except Exception as e:
         print(f"Error viewing configuration: {e}")
 
@@ -353,7 +470,7 @@ def copy_configuration(config_manager):
     print(f"\nAvailable configurations: {', '.join(configs)}")
     source_name = input("Enter source configuration name: ").strip()
     
-    if source_name not in configs:
+    if not config_manager.has_config(source_name):
         print(f"Configuration '{source_name}' not found.")
         return
     
@@ -362,18 +479,133 @@ def copy_configuration(config_manager):
         print("Target name cannot be empty.")
         return
     
-    if target_name in configs:
+    if config_manager.has_config(target_name):
         overwrite = input(f"Configuration '{target_name}' already exists. Overwrite? (y/N): ").strip().lower()
         if overwrite != 'y':
             print("Copy cancelled.")
             return
     
     try:
-        config = config_manager.load_config(source_name)
-        config_manager.save_config(config, target_name)
+        config_manager.copy_config(source_name, target_name)
         print(f"Configuration '{source_name}' copied to '{target_name}' successfully!")
     except Exception as e:
         print(f"Error copying configuration: {e}")
 
+# ──────────────────────────────────────────────────────────────────
+# Non-interactive (argparse) mode
+# ──────────────────────────────────────────────────────────────────
+
+def apply_overrides(config, overrides):
+    """Apply ``section.key[.key…]=value`` assignments to *config* in place.
+
+    Values are parsed as JSON where possible (``0.4``, ``true``, ``[1, 2]``)
+    and kept as plain strings otherwise (``aruco``).  Missing intermediate
+    sections are created.
+    """
+    for item in overrides:
+        path, sep, raw = item.partition("=")
+        if not sep or not path:
+            raise ValueError(f"Expected KEY=VALUE, got '{item}'")
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            value = raw
+        *parents, leaf = path.split(".")
+        node = config
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+    return config
+
+def _build_parser():
+    parser = argparse.ArgumentParser(description="Manage drone configuration files.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    
+    sub.add_parser("list", help="List all configurations")
+    
+    create = sub.add_parser("create", help="Create a configuration from the empty template")
+    create.add_argument("name")
+    create.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE")
+    create.add_argument("--force", action="store_true", help="Overwrite an existing configuration")
+    
+    edit = sub.add_parser("edit", help="Change values in an existing configuration "
+                                       "(interactively when no --set is given)")
+    edit.add_argument("name")
+    edit.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE")
+    edit.add_argument("--legacy", action="store_true",
+                      help="Prompt for each parameter instead of opening $EDITOR")
+    
+    delete = sub.add_parser("delete", help="Delete a configuration")
+    delete.add_argument("name")
+    
+    view = sub.add_parser("view", help="Print a configuration")
+    view.add_argument("name")
+    
+    copy = sub.add_parser("copy", help="Copy a configuration to a new name")
+    copy.add_argument("source")
+    copy.add_argument("target")
+    copy.add_argument("--force", action="store_true", help="Overwrite an existing target")
+    return parser
+
+def run_command(config_manager, argv):
+    """Run one subcommand without prompting; return a process exit code."""
+    args = _build_parser().parse_args(argv)
+    
+    try:
+        if args.command == "list":
+            for config_name in config_manager.list_configs():
+                print(config_name)
+        
+        elif args.command == "create":
+            if config_manager.has_config(args.name) and not args.force:
+                print(f"Configuration '{args.name}' already exists (use --force to overwrite).")
+                return 1
+            config = apply_overrides(config_manager._get_empty_config(), args.overrides)
+            config_manager.save_config(config, args.name)
+            print(f"Configuration '{args.name}' created.")
+        
+        elif args.command == "edit":
+            if not config_manager.has_config(args.name):
+                print(f"Configuration '{args.name}' not found.")
+                return 1
+            if not args.overrides:
+                edit_configuration(config_manager, args.legacy, args.name)
+                return 0
+            if args.legacy:
+                print("--legacy only applies to interactive editing (without --set).")
+                return 1
+            config = apply_overrides(config_manager.load_config(args.name), args.overrides)
+            config_manager.save_config(config, args.name)
+            print(f"Configuration '{args.name}' updated.")
+        
+        elif args.command == "delete":
+            if not config_manager.has_config(args.name):
+                print(f"Configuration '{args.name}' not found.")
+                return 1
+            config_manager.delete_config(args.name)
+            print(f"Configuration '{args.name}' deleted.")
+        
+        elif args.command == "view":
+            if not config_manager.has_config(args.name):
+                print(f"Configuration '{args.name}' not found.")
+                return 1
+            print(dumps_config(config_manager.load_config(args.name)))
+        
+        elif args.command == "copy":
+            if not config_manager.has_config(args.source):
+                print(f"Configuration '{args.source}' not found.")
+                return 1
+            if config_manager.has_config(args.target) and not args.force:
+                print(f"Configuration '{args.target}' already exists (use --force to overwrite).")
+                return 1
+            config_manager.copy_config(args.source, args.target)
+            print(f"Configuration '{args.source}' copied to '{args.target}'.")
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+    
+    return 0
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -8,21 +8,40 @@ import subprocess
 import sys
 import os
 
-def run_cleanup():
-    """Run the Tello cleanup utility."""
+def run_cleanup(use_subprocess=False):
+    """Run the Tello cleanup utility.
+
+    The utility runs in-process by default, which skips a second
+    interpreter start-up; ``--subprocess`` restores the old isolated run.
+    """
     print("Running Tello cleanup...")
+    if use_subprocess:
+        try:
+            result = subprocess.run(
+                [sys.executable, 'utils/tello_cleanup.py'],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            print(result.stdout)
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"Cleanup failed: {e}")
+            print(e.stderr)
+            return False
+
     try:
-        result = subprocess.run(
-            [sys.executable, 'utils/tello_cleanup.py'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        print(result.stdout)
+        from utils.tello_cleanup import main as cleanup_main
+        cleanup_main()
         return True
-    except subprocess.CalledProcessError as e:
+    except SystemExit as e:
+        # tello_cleanup.main() signals failure with sys.exit(1)
+        if e.code in (None, 0):
+            return True
+        print(f"Cleanup failed: exit status {e.code}")
+        return False
+    except Exception as e:
         print(f"Cleanup failed: {e}")
-        print(e.stderr)
         return False
 
 def main():
@@ -36,7 +55,7 @@ def main():
         sys.exit(1)
 
     # Run cleanup
-    if not run_cleanup():
+    if not run_cleanup(use_subprocess="--subprocess" in sys.argv[1:]):
         print("❌ Cleanup failed. Please run manually: python3 utils/tello_cleanup.py")
         sys.exit(1)
 
@@ -2,16 +2,32 @@ import types
 import numpy as np
 import pytest
 
-@pytest.fixture
-def mock_tello():
-    """Light-weight stub matching the few attrs your code uses."""
+#: state packet every test starts from; copied, never handed out directly
+_TELLO_STATE = {"tof": 100, "h": 100}
+
+def _noop(*args, **kwargs):
+    return None
+
+@pytest.fixture(scope="session")
+def _tello_attrs():
+    """Pristine attributes of the Tello stub (callables built once per session)."""
     stub = types.SimpleNamespace()
-    stub.ax = stub.ay = stub.az = 0.0
     # add any extra attrs you read (e.g., .get_imu, .get_mission_pad_id …)
     def get_imu(): return types.SimpleNamespace(ax=0.0, ay=0.0, az=0.0)
     stub.get_imu = get_imu
-    stub.send_rc_control = lambda *a, **kw: None
-    stub.move          = lambda *a, **kw: None
-    stub.takeoff       = lambda : None
-    stub.land          = lambda : None
+    stub.get_current_state = lambda: stub.state
+    stub.send_rc_control = _noop
+    stub.move          = _noop
+    stub.takeoff       = _noop
+    stub.land          = _noop
+    return stub, dict(vars(stub))
+
+@pytest.fixture
+def mock_tello(_tello_attrs):
+    """The shared Tello stub, reset to its pristine attributes and state for each test."""
+    stub, attrs = _tello_attrs
+    vars(stub).clear()
+    vars(stub).update(attrs)
+    stub.ax = stub.ay = stub.az = 0.0
+    stub.state = dict(_TELLO_STATE)
     return stub
@@ -1,15 +1,22 @@
 # tests/test_aruco_tracker.py
+from functools import lru_cache
+
 import numpy as np
 import cv2
-from trackers.aruco_tracker import ArucoTracker
+from trackers.aruco_tracker import ArucoTracker, get_aruco_dictionary
+
+@lru_cache(maxsize=None)
+def _marker_bgr(dict_id, marker_id, size=120):
+    """Rendered BGR marker, generated once per (dictionary, id); treat as read-only."""
+    marker = cv2.aruco.generateImageMarker(get_aruco_dictionary(dict_id), marker_id, size)
+    return cv2.cvtColor(marker, cv2.COLOR_GRAY2BGR)
 
 def generate_dummy_marker(img_size=(480, 640), dict_id=cv2.aruco.DICT_4X4_50, marker_id=0):
-    dictionary = cv2.aruco.getPredefinedDictionary(dict_id)
-    marker = cv2.aruco.generateImageMarker(dictionary, marker_id, 120)  # Larger marker
+    marker = _marker_bgr(dict_id, marker_id)  # Larger marker
     img = np.zeros(img_size + (3,), dtype=np.uint8)
     # paste marker slightly right-of-centre so error_x > 0
     x_off, y_off = img_size[1]//2 + 40, img_size[0]//2
-    img[y_off:y_off+120, x_off:x_off+120] = cv2.cvtColor(marker, cv2.COLOR_GRAY2BGR)
+    img[y_off:y_off+120, x_off:x_off+120] = marker
     return img
 
 def test_aruco_error_sign():
@@ -1,4 +1,5 @@
 # tests/test_pid_control.py
+import numpy as np
 from control_protocols.pid_control import PIDControl
 
 def test_pid_antiwindup():
@@ -8,3 +9,21 @@ def test_pid_antiwindup():
         pid.compute_control((50, 50), dt=0.1)
     assert abs(pid.integral_x) <= 10
     assert abs(pid.integral_y) <= 10
+
+def test_pid_output_saturates_at_vmax():
+    pid = PIDControl(Kp=10, Ki=0, Kd=0, vmax=25)
+    vy, vx, ud, yaw = pid.compute_control((100, -100), dt=0.1)
+    assert (vy, vx, ud, yaw) == (-25, 25, 0, 0)
+    assert all(isinstance(v, int) for v in (vy, vx))
+
+def test_pid_batch_matches_stepwise():
+    errors = [(50, 50), (-20, 5), (0, -80), (30, 30)] * 10
+    step = PIDControl(Kp=1, Ki=1, Kd=0.1, vmax=100, integral_limit=10)
+    expected = [list(step.compute_control(e, dt=0.1)[:2]) for e in errors]
+
+    batch = PIDControl(Kp=1, Ki=1, Kd=0.1, vmax=100, integral_limit=10)
+    assert batch.compute_control_batch(np.array(errors), dt=0.1).tolist() == expected
+    assert (batch.integral_x, batch.integral_y) == (step.integral_x, step.integral_y)
+
+    batch.reset()
+    assert (batch.integral_x, batch.integral_y, batch.prev_error_x, batch.prev_error_y) == (0, 0, 0, 0)
@@ -0,0 +1,68 @@
+# tests/test_tello_connector.py
+import asyncio
+
+import numpy as np
+import pytest
+from djitellopy import TelloException
+
+from connectors.tello_connector import TelloConnector
+
+
+class _StubFrameRead:
+    """Mimics djitellopy's BackgroundFrameRead: a blank placeholder frame
+    until the decoder publishes a new array after *decode_after* polls."""
+
+    def __init__(self, decode_after=None):
+        self._frame = np.zeros((300, 400, 3), dtype=np.uint8)
+        self.decoded = np.ones((720, 960, 3), dtype=np.uint8)
+        self._decode_after = decode_after
+        self.polls = 0
+
+    @property
+    def frame(self):
+        self.polls += 1
+        if self._decode_after is not None and self.polls > self._decode_after:
+            self._frame = self.decoded
+        return self._frame
+
+
+def _wait_first_frame(frame_read, timeout):
+    tc = TelloConnector()
+    tc.frame_read = frame_read
+    initial = frame_read.frame
+    return asyncio.run(asyncio.wait_for(tc._first_frame(initial), timeout=timeout))
+
+
+def test_first_frame_skips_placeholder():
+    frame_read = _StubFrameRead(decode_after=3)
+    frame = _wait_first_frame(frame_read, timeout=1.0)
+    assert frame is frame_read.decoded
+    assert frame_read.polls > 3
+
+
+def test_first_frame_times_out_without_decoded_frame():
+    with pytest.raises(asyncio.TimeoutError):
+        _wait_first_frame(_StubFrameRead(), timeout=0.2)
+
+
+class _StubSdkTello:
+    def __init__(self, reply=None, error=None):
+        self._reply = reply
+        self._error = error
+
+    def query_sdk_version(self):
+        if self._error is not None:
+            raise self._error
+        return self._reply
+
+
+@pytest.mark.parametrize("reply, error, expected", [
+    ("30", None, True),
+    ("Aborting command 'sdk?'. Did not receive a response after 7 seconds", None, False),
+    (None, TelloException("Command 'sdk?' was unsuccessful"), False),
+])
+def test_query_is_edu(reply, error, expected, caplog):
+    tc = TelloConnector()
+    tc.tello = _StubSdkTello(reply, error)
+    assert tc._query_is_edu() is expected
+    assert any(r.levelname == "WARNING" for r in caplog.records) is not expected
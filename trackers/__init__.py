@@ -1,12 +1,4 @@
-from .base_tracker import TrackerBase
-from .mission_pad_tracker import MissionPadTracker
-from .color_patch_tracker import ColorPatchTracker
-from .aruco_tracker import ArucoTracker
-from .precision_aruco_tracker import PrecisionArucoTracker
-from .circle_tracker import CircleTracker
-from .phone_tracker import PhoneTracker
-from .simple_phone_tracker import SimplePhoneTracker
-from .rect_trackers import LightRectTracker, DarkRectTracker  # re‑export helpers
+import importlib
 
 __all__: list[str] = [
     "TrackerBase",
@@ -20,3 +12,32 @@ __all__: list[str] = [
     "PhoneTracker",
     "SimplePhoneTracker",
 ]
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# one tracker (or ``trackers.base_tracker``) does not load all the others.
+_SUBMODULE_FOR: dict[str, str] = {
+    "TrackerBase": "base_tracker",
+    "MissionPadTracker": "mission_pad_tracker",
+    "ColorPatchTracker": "color_patch_tracker",
+    "LightRectTracker": "rect_trackers",  # re‑export helpers
+    "DarkRectTracker": "rect_trackers",
+    "ArucoTracker": "aruco_tracker",
+    "PrecisionArucoTracker": "precision_aruco_tracker",
+    "CircleTracker": "circle_tracker",
+    "PhoneTracker": "phone_tracker",
+    "SimplePhoneTracker": "simple_phone_tracker",
+}
+
+
+def __getattr__(name: str):
+    try:
+        submodule = _SUBMODULE_FOR[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
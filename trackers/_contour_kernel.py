@@ -0,0 +1,60 @@
+# trackers/_contour_kernel.py
+"""Per-contour shape measurements shared by :class:`CircleTracker`.
+
+Compiled with Numba when it is installed, in which case ``score_contour``
+replaces ``cv2.contourArea``/``arcLength``/``moments`` with one pass over
+the points.  Without Numba ``score_contour`` is ``None`` and callers keep
+the OpenCV calls, which beat an interpreted loop.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def _score_contour(pts):
+    """Return ``(area, perimeter, cx, cy)`` of the closed polygon *pts* (N×2).
+
+    Area and centroid use the same polygon moment formulas as OpenCV
+    (shoelace / Green's theorem); the centroid is ``(0, 0)`` for a
+    degenerate contour of zero area.
+    """
+    n = pts.shape[0]
+    a = 0.0
+    mx = 0.0
+    my = 0.0
+    perim = 0.0
+    xp = float(pts[n - 1, 0])
+    yp = float(pts[n - 1, 1])
+    for i in range(n):
+        x = float(pts[i, 0])
+        y = float(pts[i, 1])
+        cross = xp * y - x * yp
+        a += cross
+        mx += (xp + x) * cross
+        my += (yp + y) * cross
+        perim += math.sqrt((x - xp) * (x - xp) + (y - yp) * (y - yp))
+        xp = x
+        yp = y
+    if a == 0.0:
+        return 0.0, perim, 0.0, 0.0
+    return abs(a) * 0.5, perim, mx / (3.0 * a), my / (3.0 * a)
+
+
+score_contour = njit(cache=True)(_score_contour) if njit is not None else None
+
+
+def warm_up() -> None:
+    """Compile :func:`score_contour` now instead of on the first frame.
+
+    Uses the layout ``findContours`` produces after ``reshape(-1, 2)``
+    (C-contiguous int32), so the tracker hits the same specialisation.
+    A no-op without Numba.
+    """
+    if score_contour is not None:
+        score_contour(np.zeros((4, 2), dtype=np.int32))
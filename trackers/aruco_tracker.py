@@ -1,17 +1,30 @@
 # trackers/aruco_tracker.py
 
+from functools import lru_cache
+
 import cv2
 import numpy as np
 from .base_tracker import TrackerBase
 
+@lru_cache(maxsize=8)
+def get_aruco_dictionary(marker_dict=cv2.aruco.DICT_4X4_50):
+    """Shared predefined ArUco dictionary, built once per ``DICT_*`` id.
+
+    Detectors only read the dictionary, so every tracker (and test) can use
+    the same instance; do not modify it.
+    """
+    return cv2.aruco.getPredefinedDictionary(marker_dict)
+
 class ArucoTracker(TrackerBase):
-    def __init__(self, marker_size=15.0, marker_dict=cv2.aruco.DICT_4X4_50):
-        self.dictionary = cv2.aruco.getPredefinedDictionary(marker_dict)
+    def __init__(self, marker_size=15.0, marker_dict=cv2.aruco.DICT_4X4_50, detect_scale=1.0,
+                 adaptive_min=3, adaptive_max=23, adaptive_step=10, track_win_size=13,
+                 roi_margin_px=20):
+        self.dictionary = get_aruco_dictionary(marker_dict)
         self.params = cv2.aruco.DetectorParameters()
         # Adjust parameters for better detection
-        self.params.adaptiveThreshWinSizeMin = 3
-        self.params.adaptiveThreshWinSizeMax = 23
-        self.params.adaptiveThreshWinSizeStep = 10
+        self.params.adaptiveThreshWinSizeMin = adaptive_min
+        self.params.adaptiveThreshWinSizeMax = adaptive_max
+        self.params.adaptiveThreshWinSizeStep = adaptive_step
         self.params.adaptiveThreshConstant = 7
         self.params.minMarkerPerimeterRate = 0.03
         self.params.maxMarkerPerimeterRate = 4.0
@@ -25,22 +38,121 @@ class ArucoTracker(TrackerBase):
         self.params.minOtsuStdDev = 5.0
         self.params.errorCorrectionRate = 0.6
         self.marker_size = marker_size  # Marker size in cm
+        self.track_win_size = track_win_size
+        self.refresh_detector()
+        self._gray_buf = None  # reused grayscale frame, reallocated on size change
+        self._frame_shape = None  # (h, w) that _frame_center was computed for
+        self._frame_center = None
+        # Search for a lost marker on a frame downscaled by detect_scale (<1
+        # to enable); once found, detect at full resolution for exact corners
+        self.detect_scale = detect_scale
+        # While tracking, only a window of the last markers' bounding box
+        # padded by one marker size plus roi_margin_px is searched
+        self.roi_margin_px = roi_margin_px
+        self._roi = None  # (x0, y0, x1, y1) in full-frame pixels, None = search
+
+    def refresh_detector(self):
+        """(Re)build the cached detectors; call after changing ``dictionary`` or ``params``.
+
+        ``detector`` searches with the full threshold-window range in
+        ``params``.  ``track_detector`` is used while a marker is being
+        tracked: a single ``track_win_size`` window, i.e. one
+        adaptive-threshold pass instead of several.
+        """
+        self.detector = cv2.aruco.ArucoDetector(self.dictionary, self.params)
+        self.track_detector = cv2.aruco.ArucoDetector(self.dictionary, self.params)
+        track_params = self.track_detector.getDetectorParameters()
+        track_params.adaptiveThreshWinSizeMin = self.track_win_size
+        track_params.adaptiveThreshWinSizeMax = self.track_win_size
+        self.track_detector.setDetectorParameters(track_params)
+
+    def _to_gray(self, frame):
+        """Return *frame* as grayscale, converted into a reused buffer."""
+        if frame.ndim == 2:
+            return frame
+        shape = frame.shape[:2]
+        if self._gray_buf is None or self._gray_buf.shape != shape:
+            self._gray_buf = np.empty(shape, dtype=frame.dtype)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+
+    def _center_of(self, frame):
+        """Frame centre ``(cx, cy)``, recomputed only when the frame size changes."""
+        shape = frame.shape[:2]
+        if shape != self._frame_shape:
+            self._frame_shape = shape
+            self._frame_center = (shape[1] / 2, shape[0] / 2)
+        return self._frame_center
+
+    def _detect(self, gray):
+        """Detect markers in *gray*; return ``(corners, ids, scale, (ox, oy))``.
+
+        Corners are in the coordinates of the image actually searched: map
+        them back with *scale*, then add the ``(ox, oy)`` offset.  A marker
+        that has left the tracking window falls through to a full search of
+        the same frame.
+        """
+        if self._roi is not None:
+            x0, y0, x1, y1 = self._roi
+            corners, ids, _ = self.track_detector.detectMarkers(gray[y0:y1, x0:x1])
+            if ids is not None and len(ids) > 0:
+                return corners, ids, 1.0, (x0, y0)
+
+        scale = self.detect_scale
+        if scale != 1.0:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        corners, ids, _ = self.detector.detectMarkers(gray)
+        return corners, ids, scale, (0, 0)
+
+    def _roi_around(self, corners, scale, offset, shape):
+        """Tracking window around all detected *corners*, clipped to *shape*."""
+        pts = np.asarray(corners, dtype=np.float64).reshape(-1, 2)
+        x0, y0 = ((pts.min(axis=0) + 0.5) / scale - 0.5 + offset).tolist()
+        x1, y1 = ((pts.max(axis=0) + 0.5) / scale - 0.5 + offset).tolist()
+        pad = max(x1 - x0, y1 - y0) + self.roi_margin_px
+        h, w = shape
+        return (max(0, int(x0 - pad)), max(0, int(y0 - pad)),
+                min(w, int(x1 + pad) + 1), min(h, int(y1 + pad) + 1))
 
     def process_frame(self, frame, **kwargs):
-        detector = cv2.aruco.ArucoDetector(self.dictionary, self.params)
-        corners, ids, _ = detector.detectMarkers(frame)
+        # detectMarkers would convert to gray internally (allocating each call)
+        gray = self._to_gray(frame)
+        corners, ids, scale, offset = self._detect(gray)
+
+        found = ids is not None and len(ids) > 0
+        self._roi = self._roi_around(corners, scale, offset, gray.shape) if found else None
 
         debug_info = {"status": "No Marker Detected"}
-        if ids is not None and len(ids) > 0:
-            corner = corners[0][0]
-            center = np.mean(corner, axis=0)
-            frame_center = np.array([frame.shape[1]/2, frame.shape[0]/2])
-            error_x, error_y = center - frame_center
+        if found:
+            if len(ids) == 1:
+                best = 0
+                # Always exactly 4 corners: straight-line float maths beats a
+                # NumPy reduction on a 4x2 array
+                (x0, y0), (x1, y1), (x2, y2), (x3, y3) = corners[0][0].tolist()
+                cx = 0.25 * (x0 + x1 + x2 + x3)
+                cy = 0.25 * (y0 + y1 + y2 + y3)
+            else:
+                # Several markers (e.g. a board): area-weighted mean of all
+                # centres, which jitters less than any single marker
+                quads = np.asarray(corners, dtype=np.float64).reshape(-1, 4, 2)
+                x, y = quads[..., 0], quads[..., 1]
+                areas = 0.5 * np.abs((x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y).sum(axis=1))
+                cx, cy = (areas @ quads.mean(axis=1) / areas.sum()).tolist()
+                best = int(areas.argmax())
+            if scale != 1.0:
+                # Map back to full resolution (pixel-centre convention)
+                cx = (cx + 0.5) / scale - 0.5
+                cy = (cy + 0.5) / scale - 0.5
+            cx += offset[0]
+            cy += offset[1]
+            frame_cx, frame_cy = self._center_of(frame)
+            error_x = cx - frame_cx
+            error_y = cy - frame_cy
 
             debug_info = {
-                "status": f"ArUco Marker {ids[0][0]} detected",
-                "marker_id": int(ids[0][0]),
-                "center": center.tolist()
+                "status": f"ArUco Marker {ids[best][0]} detected",
+                "marker_id": int(ids[best][0]),
+                "marker_count": len(ids),
+                "center": (cx, cy)
             }
 
             return True, (error_x, error_y, 0), debug_info
@@ -29,7 +29,8 @@ debug : dict
     A dictionary with keys ``status``, ``bbox`` and ``previews``.  The ``status``
     string describes whether a circle was detected, ``bbox`` contains the
     bounding box of the detected circle (or ``None``), and ``previews`` is a list
-    of annotated images showing the processing pipeline.  Additional keys
+    of annotated images showing the processing pipeline (empty unless
+    ``process_frame`` is called with ``debug=True``).  Additional keys
     ``center``, ``area`` and ``circularity`` are included when a circle is
     detected.
 """
@@ -39,8 +40,12 @@ from __future__ import annotations
 import cv2
 import numpy as np
 
+from trackers._contour_kernel import score_contour, warm_up
 from trackers.base_tracker import TrackerBase
 
+# 3×3 structuring element for the closing step, allocated once
+_SE3 = np.ones((3, 3), np.uint8)
+
 
 class CircleTracker(TrackerBase):  # pylint: disable=too-few-public-methods
     """Contour‑based circle detector with ``TrackerBase`` interface."""
@@ -49,6 +54,7 @@ class CircleTracker(TrackerBase):  # pylint: disable=too-few-public-methods
         self,
         area_range: tuple[int, int] = (50, 5_000),
         circularity_min: float = 0.8,
+        detect_scale: float = 0.5,
     ) -> None:
         """
         Initialise a ``CircleTracker``.
@@ -61,9 +67,22 @@ class CircleTracker(TrackerBase):  # pylint: disable=too-few-public-methods
         circularity_min : float, optional
             The minimum circularity threshold (0–1).  A perfectly circular
             contour has circularity ~1.0.  Defaults to ``0.8``.
+        detect_scale : float, optional
+            Factor the grayscale frame is resized by before blur, threshold,
+            morphology and contour search.  Centres, boxes and areas are
+            mapped back to full-resolution pixels, and ``area_range`` stays
+            in full-resolution pixels.  ``1.0`` disables downscaling.
+            Defaults to ``0.5``.
         """
         self.area_range = area_range
         self.circularity_min = circularity_min
+        self.detect_scale = detect_scale
+        # Run the preprocessing chain on cv2.UMat (OpenCL T-API) when available
+        self.use_opencl = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+        # Per-stage work buffers reused across frames, reallocated on size change
+        self._buf_shape = None
+        self._bufs = None
+        warm_up()  # compile the contour kernel here, not on the first frame
 
     def process_frame(self, frame: np.ndarray, **kwargs) -> tuple[bool, tuple[int, int, int], dict]:
         """
@@ -71,14 +90,17 @@ class CircleTracker(TrackerBase):  # pylint: disable=too-few-public-methods
 
         This function implements a simple contour‑based circle detector:
 
-        1. Convert the frame to grayscale and apply Gaussian blur.
+        1. Convert the frame to grayscale, downscale it by ``detect_scale``
+           and apply Gaussian blur.
         2. Compute a binary image using Otsu’s thresholding.
         3. Apply morphological closing to join fragmented regions.
         4. Find contours and filter them by area and circularity.
         5. Choose the most circular contour as the best candidate.
 
-        The returned ``debug`` dictionary includes annotated preview images of
-        each processing stage, which can be displayed by the visual protocol.
+        When called with ``debug=True`` the returned ``debug`` dictionary
+        includes annotated preview images of each processing stage, which can
+        be displayed by the visual protocol; otherwise ``previews`` is empty
+        and no preview copies are made.
 
         Returns
         -------
@@ -86,26 +108,52 @@ class CircleTracker(TrackerBase):  # pylint: disable=too-few-public-methods
             A tuple containing a boolean indicating detection, the
             (dx, dy, dz) error vector and a debug dictionary.
         """
+        want_previews = kwargs.get("debug", False)
+
         # Pre‑allocate debug preview list
         previews: list[np.ndarray] = []
 
-        # 1. Grayscale conversion and Gaussian blur
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+        # With OpenCL the stages below stay in device memory (UMat) and are
+        # only read back for findContours, which is CPU-only
+        src = cv2.UMat(frame) if self.use_opencl else frame
+        s = self.detect_scale
+        gray_buf, small_buf, blur_buf, bin_buf, morph_buf = (
+            (None,) * 5 if self.use_opencl else self._stage_buffers(frame.shape[:2])
+        )
+
+        # 1. Grayscale conversion, downscale and Gaussian blur
+        gray = cv2.cvtColor(src, cv2.COLOR_BGR2GRAY, dst=gray_buf)
+        small = (
+            cv2.resize(
+                gray, None, dst=small_buf, fx=s, fy=s, interpolation=cv2.INTER_AREA
+            )
+            if s != 1.0 else gray
+        )
+        blurred = cv2.GaussianBlur(small, (5, 5), 0, dst=blur_buf)
 
         # 2. Otsu’s threshold to create a binary image
         _, binary = cv2.threshold(
-            blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+            blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=bin_buf
         )
 
         # 3. Morphological closing to reduce holes and noise
-        morph = cv2.morphologyEx(
-            binary, cv2.MORPH_CLOSE, np.ones((3, 3), np.uint8)
-        )
+        morph = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, _SE3, dst=morph_buf)
 
-        # 4. Find contours from the processed mask
-        contours, _ = cv2.findContours(
-            morph, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+        if self.use_opencl:
+            morph = morph.get()
+            if want_previews:
+                gray, blurred, binary = (m.get() for m in (gray, blurred, binary))
+
+        # Contour areas are in downscaled pixels
+        min_area = self.area_range[0] * s * s
+        max_area = self.area_range[1] * s * s
+
+        # 4. Find contours from the processed mask.  An 8-connected outline
+        # enclosing area A has at least 2*sqrt(2*A) pixels, so skip the
+        # search when there are too few for any candidate (e.g. an empty scene)
+        contours = (
+            cv2.findContours(morph, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)[0]
+            if cv2.countNonZero(morph) >= (8 * min_area) ** 0.5 else ()
         )
 
         # Track the best candidate by circularity
@@ -113,11 +161,17 @@ class CircleTracker(TrackerBase):  # pylint: disable=too-few-public-methods
         best_circularity = 0.0
 
         for cnt in contours:
-            area = cv2.contourArea(cnt)
+            if score_contour is not None:
+                # One compiled pass instead of three OpenCV calls
+                area, perimeter, mx, my = score_contour(cnt.reshape(-1, 2))
+            else:
+                area = cv2.contourArea(cnt)
+                perimeter = None
             # Filter by area
-            if area < self.area_range[0] or area > self.area_range[1]:
+            if area < min_area or area > max_area:
                 continue
-            perimeter = cv2.arcLength(cnt, True)
+            if perimeter is None:
+                perimeter = cv2.arcLength(cnt, True)
             if perimeter == 0:
                 continue
             circularity = 4 * np.pi * area / (perimeter ** 2)
@@ -126,61 +180,76 @@ class CircleTracker(TrackerBase):  # pylint: disable=too-few-public-methods
                 circularity > self.circularity_min
                 and circularity > best_circularity
             ):
-                M = cv2.moments(cnt)
-                if M["m00"] == 0:
+                if score_contour is None:
+                    M = cv2.moments(cnt)
+                    if M["m00"] == 0:
+                        continue
+                    mx, my = M["m10"] / M["m00"], M["m01"] / M["m00"]
+                elif area == 0:
                     continue
-                cx = int(M["m10"] / M["m00"])
-                cy = int(M["m01"] / M["m00"])
-                x, y, w, h = cv2.boundingRect(cnt)
                 best_circle = {
                     "cnt": cnt,
-                    "center": (cx, cy),
-                    "bbox": (x, y, w, h),
+                    "m": (mx, my),
                     "circularity": circularity,
                     "area": area,
                 }
                 best_circularity = circularity
 
-        # 5. Prepare debug previews
-        # Original frame
-        previews.append(self._label_img(frame.copy(), "Original"))
-        # Grayscale
-        previews.append(
-            self._label_img(cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR), "Gray")
-        )
-        # Blurred
-        previews.append(
-            self._label_img(
-                cv2.cvtColor(blurred, cv2.COLOR_GRAY2BGR), "Blurred"
+        if best_circle:
+            # Back to full-resolution pixels (pixel-centre convention)
+            mx, my = best_circle["m"]
+            cnt = best_circle["cnt"]
+            if s != 1.0:
+                cnt = np.round((cnt + 0.5) / s - 0.5).astype(np.int32)
+                best_circle["cnt"] = cnt
+                best_circle["area"] /= s * s
+            best_circle["center"] = (
+                round((mx + 0.5) / s - 0.5), round((my + 0.5) / s - 0.5)
             )
-        )
-        # Binary thresholded
-        previews.append(
-            self._label_img(
-                cv2.cvtColor(binary, cv2.COLOR_GRAY2BGR), "Binary"
+            best_circle["bbox"] = cv2.boundingRect(cnt)
+
+        # 5. Prepare debug previews (each is a full-frame copy, so only on request)
+        if want_previews:
+            # Original frame
+            previews.append(self._label_img(frame.copy(), "Original"))
+            # Grayscale
+            previews.append(
+                self._label_img(cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR), "Gray")
             )
-        )
-        # Morphology result
-        previews.append(
-            self._label_img(
-                cv2.cvtColor(morph, cv2.COLOR_GRAY2BGR), "Morph"
+            # Blurred
+            previews.append(
+                self._label_img(
+                    cv2.cvtColor(blurred, cv2.COLOR_GRAY2BGR), "Blurred"
+                )
+            )
+            # Binary thresholded
+            previews.append(
+                self._label_img(
+                    cv2.cvtColor(binary, cv2.COLOR_GRAY2BGR), "Binary"
+                )
+            )
+            # Morphology result
+            previews.append(
+                self._label_img(
+                    cv2.cvtColor(morph, cv2.COLOR_GRAY2BGR), "Morph"
+                )
             )
-        )
 
         h_img, w_img = frame.shape[:2]
         img_center = (w_img // 2, h_img // 2)
 
         if best_circle:
-            # Annotate the best contour on a copy of the frame
-            frame_annotated = frame.copy()
             cnt = best_circle["cnt"]
             bbox = best_circle["bbox"]
             cx, cy = best_circle["center"]
-            # Draw contour outline and centre point
-            cv2.drawContours(frame_annotated, [cnt], -1, (0, 255, 0), 2)
-            cv2.circle(frame_annotated, (cx, cy), 5, (0, 0, 255), -1)
-            # Include annotated image in previews
-            previews.append(self._label_img(frame_annotated, "Circle Detected"))
+            if want_previews:
+                # Annotate the best contour on a copy of the frame
+                frame_annotated = frame.copy()
+                # Draw contour outline and centre point
+                cv2.drawContours(frame_annotated, [cnt], -1, (0, 255, 0), 2)
+                cv2.circle(frame_annotated, (cx, cy), 5, (0, 0, 255), -1)
+                # Include annotated image in previews
+                previews.append(self._label_img(frame_annotated, "Circle Detected"))
             # Compute error relative to image centre
             error_x = cx - img_center[0]
             error_y = cy - img_center[1]
@@ -196,8 +265,8 @@ class CircleTracker(TrackerBase):  # pylint: disable=too-few-public-methods
             return True, (error_x, error_y, error_z), debug
         else:
             # No circle found – include an annotated image explaining failure
-            frame_annotated = frame.copy()
-            previews.append(self._label_img(frame_annotated, "No Circle"))
+            if want_previews:
+                previews.append(self._label_img(frame.copy(), "No Circle"))
             debug = {
                 "status": "No Circle Detected",
                 "bbox": None,
@@ -205,6 +274,26 @@ class CircleTracker(TrackerBase):  # pylint: disable=too-few-public-methods
             }
             return False, (0, 0, 0), debug
 
+    def _stage_buffers(self, shape: tuple[int, int]) -> tuple[np.ndarray, ...]:
+        """
+        Return the ``(gray, small, blurred, binary, morph)`` work buffers.
+
+        They are allocated on the first frame and again only when the frame
+        size changes.  ``small`` and the later stages are sized like
+        ``cv2.resize`` with ``fx = fy = detect_scale`` (rounded half to even,
+        like OpenCV's ``cvRound``).
+        """
+        if shape != self._buf_shape:
+            h, w = shape
+            s = self.detect_scale
+            small = (round(h * s), round(w * s))
+            self._buf_shape = shape
+            self._bufs = (
+                np.empty(shape, np.uint8),
+                *(np.empty(small, np.uint8) for _ in range(4)),
+            )
+        return self._bufs
+
     def draw_debug_info(self, frame: np.ndarray, debug_info: dict) -> None:
         """
         Draw debug annotations on a frame.
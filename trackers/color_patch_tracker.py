@@ -6,11 +6,16 @@ class ColorPatchTracker(TrackerBase):
     """Detects a red rectangle on yellow background & returns pixel error."""
 
     def process_frame(self, frame, **kwargs):  # noqa: D401
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-        mask = self._red_mask(hsv)
-        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        mask = self._red_mask(frame)
 
         debug = {}
+        # An 8-connected outline enclosing area A has at least 2*sqrt(2*A)
+        # pixels, so fewer than 2*sqrt(200) cannot pass the tiny-noise check
+        if cv2.countNonZero(mask) < 28:
+            debug["status"] = "NO PATCH"
+            return False, (0, 0, 0), debug
+
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         if not contours:
             debug["status"] = "NO PATCH"
             return False, (0, 0, 0), debug
@@ -33,11 +38,11 @@ class ColorPatchTracker(TrackerBase):
 
     # ------------------------------------------------------------------
     @staticmethod
-    def _red_mask(hsv):
-        lower1 = np.array([0, 80, 80])
-        upper1 = np.array([10, 255, 255])
-        lower2 = np.array([160, 80, 80])
-        upper2 = np.array([179, 255, 255])
-        mask  = cv2.inRange(hsv, lower1, upper1)
-        mask |= cv2.inRange(hsv, lower2, upper2)
-        return mask
+    def _red_mask(frame):
+        # Red directly in BGR, no HSV conversion: R > 80 and R > 1.5·max(G, B)
+        b, g, r = cv2.split(frame)
+        m = cv2.max(g, b)
+        # floor(1.5·m) in saturating uint8: if it clips at 255, no R exceeds it
+        # anyway, so the comparison stays exact
+        thresh = cv2.max(cv2.add(m, m >> 1), 80)
+        return cv2.compare(r, thresh, cv2.CMP_GT)
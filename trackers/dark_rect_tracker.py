@@ -1,8 +1,18 @@
+import math
+
 import cv2
 import numpy as np
 import supervision as sv
 from trackers.base_tracker import TrackerBase
 
+# Morphology kernel, built once rather than on every frame
+_SE11 = cv2.getStructuringElement(cv2.MORPH_RECT, (11, 11))
+
+_MIN_RECT_AREA = 500
+# Fewest mask pixels whose outline can enclose more than _MIN_RECT_AREA: an
+# 8-connected closed curve needs at least 2*sqrt(2*A) pixels (a diamond).
+_MIN_RECT_PX = int(2 * math.sqrt(2 * _MIN_RECT_AREA))
+
 class DarkRectTracker(TrackerBase):
     """Detects the largest dark rectangle on bright background."""
 
@@ -15,8 +25,7 @@ class DarkRectTracker(TrackerBase):
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         blur = cv2.GaussianBlur(gray, (7, 7), 0)
         _, thresh = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-        morph = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE,
-                                 cv2.getStructuringElement(cv2.MORPH_RECT, (11, 11)))
+        morph = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, _SE11)
         best_rect, center = self._find_best_rect(morph)
 
         debug = {}
@@ -36,6 +45,9 @@ class DarkRectTracker(TrackerBase):
     # ------------------------------------------------------------------
     @staticmethod
     def _find_best_rect(binary):
+        # Too few pixels to outline any contour large enough to accept
+        if cv2.countNonZero(binary) <= _MIN_RECT_PX:
+            return None, None
         contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         best_rect = None
         center = None
@@ -44,7 +56,7 @@ class DarkRectTracker(TrackerBase):
         img_area = h_img * w_img
         for cnt in contours:
             area = cv2.contourArea(cnt)
-            if not (500 < area < 0.6 * img_area):
+            if not (_MIN_RECT_AREA < area < 0.6 * img_area):
                 continue
             epsilon = 0.03 * cv2.arcLength(cnt, True)
             approx = cv2.approxPolyDP(cnt, epsilon, True)
@@ -3,11 +3,12 @@
 import cv2
 import numpy as np
 from .base_tracker import TrackerBase
+from .aruco_tracker import get_aruco_dictionary
 
 class PrecisionArucoTracker(TrackerBase):
     def __init__(self, marker_size=15.0, marker_dict=cv2.aruco.DICT_4X4_50, 
                  camera_matrix=None, dist_coeffs=None):
-        self.dictionary = cv2.aruco.getPredefinedDictionary(marker_dict)
+        self.dictionary = get_aruco_dictionary(marker_dict)
         self.params = cv2.aruco.DetectorParameters()
         
         # Adjust parameters for better detection
@@ -27,6 +28,10 @@ class PrecisionArucoTracker(TrackerBase):
         self.params.errorCorrectionRate = 0.6
         
         self.marker_size = marker_size  # Marker size in cm
+        self.refresh_detector()
+        self._gray_buf = None  # reused grayscale frame, reallocated on size change
+        self._frame_shape = None  # (h, w) that _frame_center was computed for
+        self._frame_center = None
         
         # Camera calibration parameters (if not provided, use default Tello camera)
         if camera_matrix is None:
@@ -45,19 +50,45 @@ class PrecisionArucoTracker(TrackerBase):
         else:
             self.dist_coeffs = dist_coeffs
 
+    def refresh_detector(self):
+        """(Re)build the cached detector; call after changing ``dictionary`` or ``params``."""
+        self.detector = cv2.aruco.ArucoDetector(self.dictionary, self.params)
+
+    def _to_gray(self, frame):
+        """Return *frame* as grayscale, converted into a reused buffer."""
+        if frame.ndim == 2:
+            return frame
+        shape = frame.shape[:2]
+        if self._gray_buf is None or self._gray_buf.shape != shape:
+            self._gray_buf = np.empty(shape, dtype=frame.dtype)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+
+    def _center_of(self, frame):
+        """Frame centre ``(cx, cy)``, recomputed only when the frame size changes."""
+        shape = frame.shape[:2]
+        if shape != self._frame_shape:
+            self._frame_shape = shape
+            self._frame_center = (shape[1] / 2, shape[0] / 2)
+        return self._frame_center
+
     def process_frame(self, frame, **kwargs):
-        detector = cv2.aruco.ArucoDetector(self.dictionary, self.params)
-        corners, ids, _ = detector.detectMarkers(frame)
+        # detectMarkers would convert to gray internally (allocating each call)
+        corners, ids, _ = self.detector.detectMarkers(self._to_gray(frame))
 
         debug_info = {"status": "No Marker Detected"}
         
         if ids is not None and len(ids) > 0:
             corner = corners[0][0]
-            center = np.mean(corner, axis=0)
-            frame_center = np.array([frame.shape[1]/2, frame.shape[0]/2])
+            # Always exactly 4 corners: straight-line float maths beats a
+            # NumPy reduction on a 4x2 array
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = corner.tolist()
+            cx = 0.25 * (x0 + x1 + x2 + x3)
+            cy = 0.25 * (y0 + y1 + y2 + y3)
+            frame_cx, frame_cy = self._center_of(frame)
             
             # Calculate lateral error
-            error_x, error_y = center - frame_center
+            error_x = cx - frame_cx
+            error_y = cy - frame_cy
             
             # Estimate pose and calculate relative orientation
             rvecs, tvecs, _ = cv2.aruco.estimatePoseSingleMarkers(
@@ -90,7 +121,7 @@ class PrecisionArucoTracker(TrackerBase):
                 debug_info = {
                     "status": f"ArUco Marker {ids[0][0]} detected",
                     "marker_id": int(ids[0][0]),
-                    "center": center.tolist(),
+                    "center": (cx, cy),
                     "distance": float(distance),
                     "yaw": float(yaw),
                     "area_percentage": float(area_percentage),
@@ -4,6 +4,9 @@ import cv2
 import numpy as np
 from .base_tracker import TrackerBase
 
+# Morphology kernel, built once rather than on every frame
+_SE3 = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
 class SimplePhoneTracker(TrackerBase):
     """Detects phone-like objects using basic computer vision techniques."""
 
@@ -46,9 +49,8 @@ class SimplePhoneTracker(TrackerBase):
                                      cv2.THRESH_BINARY, 11, 2)
 
         # Apply morphological operations
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-        morph = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-        morph = cv2.morphologyEx(morph, cv2.MORPH_OPEN, kernel)
+        morph = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, _SE3)
+        morph = cv2.morphologyEx(morph, cv2.MORPH_OPEN, _SE3)
 
         # Find contours
         contours, _ = cv2.findContours(morph, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -1,10 +1,22 @@
 from .logging_utils import setup_logger
-from .setup_utils import (
-    select_tracker,
-    select_control_protocol,
-    configure_landing,
-    select_visual_protocol,
-)
+
+# setup_utils pulls in every tracker / landing protocol, and landing
+# protocols import utils.async_logger – resolve those names on first use
+# so importing a light utils submodule never drags the whole app in.
+_SETUP_UTILS_EXPORTS = {
+    "select_tracker",
+    "select_control_protocol",
+    "configure_landing",
+    "select_visual_protocol",
+}
+
+
+def __getattr__(name):
+    if name in _SETUP_UTILS_EXPORTS:
+        from . import setup_utils
+        return getattr(setup_utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__: list[str] = [
     "setup_logger",
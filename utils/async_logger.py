@@ -0,0 +1,94 @@
+# utils/async_logger.py
+"""
+Deferred logging for hot control loops.
+
+Records are created at the call site – so timestamps, levels and caller
+info are exact – then passed through an unbounded queue to a
+:class:`logging.handlers.QueueListener` thread that writes them to the root
+logger's handlers, so handler I/O (console / log file) never stalls the
+caller.  ``QueueHandler`` formats the message as it is queued, so no
+references to mutable arguments or exceptions outlive the call, and
+nothing is queued at all when the level is disabled.
+
+Queued lines can still reach the log after synchronous ``logging`` output
+issued later by the same code.  Use this for messages repeated every loop
+tick; one-off events belong on plain ``logging``.
+
+Usage
+-----
+>>> from utils import async_logger as alog
+>>> alog.warning("Tracker error during alignment: %s", e)
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+
+_logger = logging.getLogger(__name__)
+_logger.propagate = False  # the listener writes to the root handlers itself
+_listener: logging.handlers.QueueListener | None = None
+_listener_lock = threading.Lock()
+
+
+def start() -> None:
+    """Start the writer thread, if not already running.
+
+    Called automatically by the first queued record.  Call it explicitly
+    once logging is configured: the listener forwards to the root handlers
+    present at that point.
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        _logger.addHandler(logging.handlers.QueueHandler(records))
+        handlers = logging.getLogger().handlers or [logging.lastResort]
+        _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        _listener.start()
+
+
+def stop() -> None:
+    """Write every queued record and stop the writer (called automatically at exit)."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        _listener = None
+        for handler in list(_logger.handlers):
+            _logger.removeHandler(handler)
+
+
+def _log(level: int, msg: str, args: tuple) -> None:
+    if _logger.isEnabledFor(level):
+        if _listener is None:
+            start()
+        # stacklevel: attribute the record to our caller's caller
+        _logger.log(level, msg, *args, stacklevel=3)
+
+
+def log(level: int, msg: str, *args) -> None:
+    """Queue *msg* % *args* at *level* if the root logger would emit it."""
+    _log(level, msg, args)
+
+
+def debug(msg: str, *args) -> None:
+    _log(logging.DEBUG, msg, args)
+
+
+def info(msg: str, *args) -> None:
+    _log(logging.INFO, msg, args)
+
+
+def warning(msg: str, *args) -> None:
+    _log(logging.WARNING, msg, args)
+
+
+def error(msg: str, *args) -> None:
+    _log(logging.ERROR, msg, args)
+
+
+atexit.register(stop)
@@ -3,12 +3,50 @@ Configuration manager for drone project settings.
 Handles loading, saving, and validating configuration files.
 """
 
+import bisect
+import copy
+import functools
 import json
 import os
 import logging
+import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json produces the same layout
+    orjson = None
+
+
+def dumps_config(config: Dict[str, Any]) -> str:
+    """Pretty-print *config* as 2-space-indented JSON.
+
+    Uses orjson's C serializer when installed; stdlib ``json`` with
+    ``indent`` runs its pure-Python encoder instead.  Output is identical
+    except that orjson writes non-ASCII characters as UTF-8 rather than
+    ``\\u`` escapes, so config files are read and written as UTF-8.
+    """
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(config, indent=2)
+
+
+def loads_config(data: bytes) -> Dict[str, Any]:
+    """Parse raw config file bytes, with orjson when installed.
+
+    Both parsers raise a ``json.JSONDecodeError`` subclass on bad input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Built-in defaults (empty config template, default drone settings), parsed
+# once at import
+_DEFAULTS = loads_config(Path(__file__).with_name("_defaults.json").read_bytes())
+
+
 class ConfigManager:
     """Manages configuration files for the drone project."""
     
@@ -17,6 +55,14 @@ class ConfigManager:
         self.config_dir.mkdir(exist_ok=True)
         self.default_config_path = self.config_dir / "default_config.json"
         self.user_config_path = self.config_dir / "user_config.json"
+        # Parsed configs keyed by path -> ((mtime_ns, size), config), and the
+        # directory listing (sorted names and a frozenset of them) keyed by
+        # the directory's mtime_ns.  A stat() is enough to tell whether the
+        # file changed, so repeat loads within a session skip the read and
+        # parse.  Our own saves, copies and deletes patch the cached listing
+        # in place (_update_listing).
+        self._config_cache: Dict[Path, tuple] = {}
+        self._list_cache: Optional[tuple] = None
         
     def load_config(self, config_name: str = "user") -> Dict[str, Any]:
         """
@@ -26,7 +72,8 @@ class ConfigManager:
             config_name: Name of config file (without .json extension)
             
         Returns:
-            Dictionary containing configuration
+            Dictionary containing configuration (a private copy; callers
+            may modify it freely)
         """
         config_path = self.config_dir / f"{config_name}.json"
         
@@ -39,10 +86,17 @@ class ConfigManager:
                 raise FileNotFoundError(f"Configuration file {config_path} not found")
         
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            st = config_path.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._config_cache.get(config_path)
+            if cached is not None and cached[0] == key:
+                logging.debug(f"Using cached configuration for {config_path}")
+                return copy.deepcopy(cached[1])
+            
+            config = loads_config(config_path.read_bytes())
+            self._config_cache[config_path] = (key, config)
             logging.info(f"Loaded configuration from {config_path}")
-            return config
+            return copy.deepcopy(config)
         except json.JSONDecodeError as e:
             logging.error(f"Invalid JSON in config file {config_path}: {e}")
             raise
@@ -61,20 +115,85 @@ class ConfigManager:
         config_path = self.config_dir / f"{config_name}.json"
         
         try:
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            dir_mtime = self.config_dir.stat().st_mtime_ns
+            with open(config_path, 'w', encoding='utf-8') as f:
+                f.write(dumps_config(config))
+            self._config_cache.pop(config_path, None)
+            self._update_listing(config_name, True, dir_mtime)
             logging.info(f"Saved configuration to {config_path}")
         except Exception as e:
             logging.error(f"Error saving config file {config_path}: {e}")
             raise
     
+    def copy_config(self, source_name: str, target_name: str) -> None:
+        """
+        Copy a configuration file to a new name.
+        
+        The file is copied byte for byte; there is no need to parse and
+        re-serialize it just to clone it.
+        
+        Args:
+            source_name: Name of the existing config (without .json extension)
+            target_name: Name of the new config (without .json extension)
+        """
+        source_path = self.config_dir / f"{source_name}.json"
+        target_path = self.config_dir / f"{target_name}.json"
+        
+        try:
+            dir_mtime = self.config_dir.stat().st_mtime_ns
+            shutil.copyfile(source_path, target_path)
+            self._config_cache.pop(target_path, None)
+            self._update_listing(target_name, True, dir_mtime)
+            logging.info(f"Copied configuration {source_path} to {target_path}")
+        except Exception as e:
+            logging.error(f"Error copying config file {source_path}: {e}")
+            raise
+    
+    def delete_config(self, config_name: str) -> None:
+        """
+        Delete a configuration file.
+        
+        Args:
+            config_name: Name of config file (without .json extension)
+        """
+        config_path = self.config_dir / f"{config_name}.json"
+        
+        try:
+            dir_mtime = self.config_dir.stat().st_mtime_ns
+            config_path.unlink()
+            self._config_cache.pop(config_path, None)
+            self._update_listing(config_name, False, dir_mtime)
+            logging.info(f"Deleted configuration {config_path}")
+        except Exception as e:
+            logging.error(f"Error deleting config file {config_path}: {e}")
+            raise
+    
+    def _update_listing(self, config_name: str, present: bool, dir_mtime: int) -> None:
+        """Apply one of our own adds/removes to the cached config listing.
+        
+        *dir_mtime* is the directory mtime taken just before the change.  If
+        the cache was already stale then, it is dropped instead and the next
+        :meth:`list_configs` re-scans.
+        """
+        cached = self._list_cache
+        if cached is None or cached[0] != dir_mtime:
+            self._list_cache = None
+            return
+        
+        configs = cached[1]
+        i = bisect.bisect_left(configs, config_name)
+        found = i < len(configs) and configs[i] == config_name
+        if present and not found:
+            configs.insert(i, config_name)
+        elif not present and found:
+            del configs[i]
+        self._list_cache = (self.config_dir.stat().st_mtime_ns, configs, frozenset(configs))
+    
     def _create_user_config(self) -> None:
         """Create user config file from default config."""
         if self.default_config_path.exists():
             try:
-                with open(self.default_config_path, 'r') as f:
-                    default_config = json.load(f)
-                self.save_config(default_config, "user")
+                self.copy_config(self.default_config_path.stem, "user")
                 logging.info("Created user config from default config")
             except Exception as e:
                 logging.error(f"Error creating user config: {e}")
@@ -86,23 +205,29 @@ class ConfigManager:
     
     def _get_empty_config(self) -> Dict[str, Any]:
         """Get an empty configuration template."""
-        return {
-            "tracker": {"type": "circle", "parameters": {}},
-            "control_protocol": {"type": "pid", "parameters": {}},
-            "landing_protocol": {"type": "multilayer", "parameters": {}},
-            "visual_protocol": {"type": "opencv", "parameters": {}},
-            "drone_settings": {},
-            "precision_landing": {},
-            "continuous_glide": {},
-            "grid_visual": {}
-        }
+        return copy.deepcopy(_DEFAULTS["empty_config"])
     
-    def list_configs(self) -> list:
-        """List all available configuration files."""
+    def _listing(self) -> tuple:
+        """Return the cached ``(sorted names, frozenset of names)`` listing."""
+        # Adding, removing or renaming a file bumps the directory mtime
+        dir_mtime = self.config_dir.stat().st_mtime_ns
+        if self._list_cache is not None and self._list_cache[0] == dir_mtime:
+            return self._list_cache[1:]
+        
         configs = []
         for config_file in self.config_dir.glob("*.json"):
             configs.append(config_file.stem)
-        return sorted(configs)
+        configs.sort()
+        self._list_cache = (dir_mtime, configs, frozenset(configs))
+        return self._list_cache[1:]
+    
+    def list_configs(self) -> list:
+        """List all available configuration files (sorted by name)."""
+        return list(self._listing()[0])
+    
+    def has_config(self, config_name: str) -> bool:
+        """Return whether a configuration file named *config_name* exists."""
+        return config_name in self._listing()[1]
     
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -158,6 +283,15 @@ class ConfigManager:
         """Extract drone settings from config dict."""
         return config.get("drone_settings", {})
 
+@functools.cache
+def get_config_manager(config_dir: str = "config") -> ConfigManager:
+    """Return the shared :class:`ConfigManager` for *config_dir*.
+    
+    Callers share one instance, and with it the parsed-config and
+    directory-listing caches.
+    """
+    return ConfigManager(config_dir)
+
 def create_config_from_user_input() -> Dict[str, Any]:
     """
     Interactive function to create a configuration from user input.
@@ -296,8 +430,4 @@ def _extract_visual_parameters(visual_protocol):
 
 def _extract_drone_settings():
     """Extract default drone settings for configuration."""
-    return {
-        "takeoff_height": 30,
-        "target_height": 30,
-        "timeout": 40
-    } 
\ No newline at end of file
+    return dict(_DEFAULTS["drone_settings"])
@@ -3,11 +3,21 @@ import logging
 import os
 import datetime
 
+_LOGGER_READY = False
+
 def setup_logger(log_file: str | None = None, level=logging.INFO):
     """
     Initialise Python's root logger.  If log_file is None, create a unique
     timestamped log in a 'logs' directory.
+
+    Only the first call has an effect; later calls would otherwise open
+    (and leave empty) another log file that ``basicConfig`` then ignores.
     """
+    global _LOGGER_READY
+    if _LOGGER_READY:
+        return
+    _LOGGER_READY = True
+
     if log_file is None:
         log_dir = "logs"
         os.makedirs(log_dir, exist_ok=True)
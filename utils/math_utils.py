@@ -1,5 +1,5 @@
 # utils/math_utils.py
-import numpy as np
+import math
 
 def clamp(val, lo, hi):
     """Return *val* bounded to [lo, hi]."""
@@ -7,4 +7,4 @@ def clamp(val, lo, hi):
 
 def vec_length(vec):
     """Euclidean length of a 2- or 3-element iterable."""
-    return float(np.linalg.norm(vec))
+    return math.hypot(*vec)
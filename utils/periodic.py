@@ -0,0 +1,47 @@
+# utils/periodic.py
+"""
+Fixed-period scheduling for control loops.
+
+``time.sleep(period)`` after each iteration makes the real period
+``period + work``, and that drifts with tracker cost.  :class:`PeriodicTicker`
+sleeps to absolute deadlines on the monotonic clock instead, so work time
+is absorbed into the period.
+
+Usage
+-----
+>>> ticker = PeriodicTicker(0.05)
+>>> while running:
+...     step()
+...     ticker.wait()
+"""
+
+import time
+
+
+class PeriodicTicker:
+    """Sleep until successive deadlines ``period`` seconds apart.
+
+    If an iteration overruns its deadline, the schedule restarts from the
+    current time rather than firing a burst of late ticks to catch up.
+    """
+
+    __slots__ = ("period", "_next")
+
+    def __init__(self, period: float = 0.05) -> None:
+        self.period = period
+        self._next = time.monotonic()
+
+    def reset(self) -> None:
+        """Restart the schedule from now (e.g. after a blocking call)."""
+        self._next = time.monotonic()
+
+    def wait(self) -> float:
+        """Block until the next deadline; return the time slept (s)."""
+        self._next += self.period
+        delay = self._next - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+            return delay
+        self._next = time.monotonic()
+        return 0.0
+
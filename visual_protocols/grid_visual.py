@@ -11,8 +11,10 @@ grid_shape and cell_size and by overriding _render_cell().
 import cv2
 import numpy as np
 import logging
+import threading
 from typing import Dict, Tuple, Any
 from visual_protocols.base_visual import VisualProtocol
+from visual_protocols.opencv_visual import poll_quit_key
 
 class GridVisualProtocol(VisualProtocol):
     """Display multiple diagnostics in a grid layout."""
@@ -29,6 +31,8 @@ class GridVisualProtocol(VisualProtocol):
         self.window_created = False
         self._frame_buffer = None
         self._debug_buffer = None
+        # 'q' in the grid window sets this; TelloTargetFollower checks it each tick
+        self.quit_requested = threading.Event()
 
     def initialize_window(self) -> None:
         try:
@@ -98,7 +102,8 @@ class GridVisualProtocol(VisualProtocol):
                     x0 = c * self.cell_w
                     canvas[y0:y0 + self.cell_h, x0:x0 + self.cell_w] = cell_resized
             cv2.imshow(self.window_name, canvas)
-            cv2.waitKey(1)  # Update window
+            # Update window and pick up the quit key
+            poll_quit_key(self.quit_requested)
         except Exception as e:
             logging.exception(f"GridVisualProtocol display error: {e}")
 
@@ -114,8 +119,8 @@ class GridVisualProtocol(VisualProtocol):
         Override this method to customise other cells or different grid sizes.
         """
         if index == 0:
-            # Raw frame
-            return frame.copy()
+            # Raw frame (read-only here – the caller resizes into the canvas)
+            return frame
 
         elif index == 1:
             # Tracker view: draw candidate circles and bounding box
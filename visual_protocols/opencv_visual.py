@@ -2,8 +2,19 @@
 
 import cv2
 import logging
+import threading
 from .base_visual import VisualProtocol
 
+QUIT_KEY = ord('q')
+
+# pollKey() (OpenCV >= 4.5) pumps HighGUI events without waitKey(1)'s sleep
+_poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
+
+def poll_quit_key(quit_requested):
+    """Process pending window events; set *quit_requested* if 'q' was pressed."""
+    if _poll_key() & 0xFF == QUIT_KEY:
+        quit_requested.set()
+
 class OpenCVVisualProtocol(VisualProtocol):
     """OpenCV-based visual protocol for real-time drone tracking display."""
 
@@ -13,6 +24,8 @@ class OpenCVVisualProtocol(VisualProtocol):
         self.window_created = False
         self._frame_buffer = None
         self._debug_buffer = None
+        # Set when 'q' is pressed in the window; polled by the follower loop
+        self.quit_requested = threading.Event()
 
     def initialize_window(self):
         """Initialize the OpenCV window in the main thread."""
@@ -45,16 +58,19 @@ class OpenCVVisualProtocol(VisualProtocol):
             return
 
         try:
-            # Create a copy for drawing
-            display_frame = self._frame_buffer.copy()
+            # show() already stored a private copy; only copy again when we
+            # are about to draw on it (the buffer may be redisplayed)
+            display_frame = self._frame_buffer
 
             # Add debug information overlay
             if self._debug_buffer and self.debug_level == "detailed":
+                display_frame = display_frame.copy()
                 self._draw_debug_info(display_frame, self._debug_buffer)
 
             # Display the frame
             cv2.imshow(self.window_name, display_frame)
-            cv2.waitKey(1)  # Update window
+            # Update window and record the quit key
+            poll_quit_key(self.quit_requested)
 
             # Log frame display for debugging
             logging.debug(f"Displayed frame shape: {display_frame.shape}")
@@ -73,7 +89,8 @@ class OpenCVVisualProtocol(VisualProtocol):
             window_name = f"{self.window_name}_{name}"
             cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
             cv2.imshow(window_name, img)
-            cv2.waitKey(1)
+        # One event pump refreshes every window
+        poll_quit_key(self.quit_requested)
 
     def close(self):
         """Close all OpenCV windows."""
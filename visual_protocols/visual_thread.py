@@ -1,37 +1,54 @@
 # visual_protocols/visual_thread.py
 
-from threading import Thread
+from threading import Event, Thread
 import logging
-import time
 
 class VisualThread(Thread):
     def __init__(self, visual_protocol):
         super().__init__()
         self.visual_protocol = visual_protocol
-        self.frame = None
-        self.debug = None
+        # Single-producer/single-consumer mailbox: the control thread swaps in
+        # one ``(seq, frame, debug)`` tuple per frame.  Rebinding an attribute
+        # is atomic under the GIL, so the control thread never waits on the
+        # visual thread, the frame and its debug dict always travel together,
+        # and frames not yet picked up are simply superseded.
+        self._latest = (0, None, None)
+        self._seq = 0
+        # Wakes run() as soon as a frame is published instead of polling
+        self._new_frame = Event()
         self.running = True
 
+    def publish(self, frame, debug=None):
+        """Hand *frame* and its *debug* info to the thread (non-blocking)."""
+        self._seq += 1
+        self._latest = (self._seq, frame, debug)
+        self._new_frame.set()
+
     def run(self):
         logging.info("Visualization thread started.")
+        last_seq = 0
         while self.running:
-            if self.frame is not None:
+            # Timeout only so a missed stop() wake-up cannot hang the thread
+            if not self._new_frame.wait(timeout=0.1):
+                continue
+            self._new_frame.clear()  # before reading, so a later publish re-arms it
+            seq, frame, debug = self._latest
+            if seq != last_seq and frame is not None:
+                last_seq = seq
                 try:
                     # For OpenCV protocols, only buffer the frame
                     if hasattr(self.visual_protocol, '_frame_buffer'):
                         # Just store the frame, let main thread handle display
-                        self.visual_protocol.show(self.frame, self.debug)
+                        self.visual_protocol.show(frame, debug)
                     else:
                         # For non-OpenCV protocols (like console logger), display directly
-                        self.visual_protocol.show(self.frame, self.debug)
-                        if self.debug and self.debug.get("previews"):
-                            self.visual_protocol.show_previews(self.debug["previews"])
+                        self.visual_protocol.show(frame, debug)
+                        if debug and debug.get("previews"):
+                            self.visual_protocol.show_previews(debug["previews"])
                 except Exception as e:
                     logging.exception(f"Visualization error: {e}")
-                finally:
-                    self.frame = None
-            time.sleep(0.01)
 
     def stop(self):
         self.running = False
+        self._new_frame.set()  # wake run() so it sees running == False
         logging.info("Visualization thread stopping.")